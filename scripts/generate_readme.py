@@ -8,6 +8,7 @@ This script uses a template-based approach:
 Placeholders in template:
 - <!-- GENERATED:BADGE_LINE --> : Auto-update timestamp and endpoint count
 - <!-- GENERATED:API_TABLE --> : Endpoint table from OpenAPI spec
+- <!-- GENERATED:PROXY_ROUTES --> : Gateway proxy route table
 - <!-- GENERATED:RESPONSE_CODES --> : Common HTTP response codes
 - <!-- GENERATED:STATS --> : Documentation statistics footer
 
@@ -17,114 +18,242 @@ Usage:
   The workflow will inject dynamic content on each run.
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Set, Any
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set, Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Input/output paths (repo root relative to this script)
+_REPO_ROOT = Path(__file__).parent.parent
+SPEC_PATH = _REPO_ROOT / "docs" / "api" / "openapi.json"
+TEMPLATE_PATH = _REPO_ROOT / "README_TEMPLATE.md"
+README_PATH = _REPO_ROOT / "README.md"
+
+# Sidecar recording the input digest of the last successful generation
+HASH_PATH = _REPO_ROOT / "README.md.hash"
+
+# HTTP methods that count as documented endpoints (O(1) hashed membership)
+_HTTP_METHODS = frozenset(('get', 'post', 'put', 'delete', 'patch'))
+
+# Matches <!-- GENERATED:PLACEHOLDER --> markers in the template
+_PLACEHOLDER_RE = re.compile(r'<!-- GENERATED:(\w+) -->')
+
+# Gateway proxy routes: (route pattern, backend service, port, description).
+# Module-level constant so the table rows are not re-allocated per call.
+_PROXY_ROUTES = (
+    ('/api/v1/auth/*', 'fm-auth-service', '8001', 'Authentication and authorization'),
+    ('/api/v1/sessions/*', 'fm-session-service', '8002', 'Investigation session management'),
+    ('/api/v1/cases/*', 'fm-case-service', '8003', 'Case lifecycle management'),
+    ('/api/v1/hypotheses/*', 'fm-case-service', '8003', 'Hypothesis tracking (part of cases)'),
+    ('/api/v1/solutions/*', 'fm-case-service', '8003', 'Solution management (part of cases)'),
+    ('/api/v1/knowledge/*', 'fm-knowledge-service', '8004', 'Knowledge base and recommendations'),
+    ('/api/v1/evidence/*', 'fm-evidence-service', '8005', 'Evidence artifact storage'),
+    ('/api/v1/agent/*', 'fm-agent-service', '8006', 'AI agent orchestration'),
+)
 
 
 def load_openapi_spec() -> Dict[str, Any]:
     """Load OpenAPI spec from docs/api/openapi.json"""
-    spec_path = Path(__file__).parent.parent / "docs" / "api" / "openapi.json"
-
-    if not spec_path.exists():
+    if not SPEC_PATH.exists():
         raise FileNotFoundError(
-            f"OpenAPI spec not found at {spec_path}. "
+            f"OpenAPI spec not found at {SPEC_PATH}. "
             "Run the app to generate it first."
         )
 
-    with open(spec_path, 'r') as f:
+    # orjson parses bytes directly (C-accelerated), ~3-10x faster than stdlib
+    # json for megabyte-scale specs
+    if ORJSON_AVAILABLE:
+        return orjson.loads(SPEC_PATH.read_bytes())
+
+    with open(SPEC_PATH, 'r') as f:
         return json.load(f)
 
 
 def load_template() -> str:
     """Load README template file"""
-    template_path = Path(__file__).parent.parent / "README_TEMPLATE.md"
-
-    if not template_path.exists():
+    if not TEMPLATE_PATH.exists():
         raise FileNotFoundError(
-            f"README template not found at {template_path}. "
+            f"README template not found at {TEMPLATE_PATH}. "
             "Create README_TEMPLATE.md with placeholders."
         )
 
-    with open(template_path, 'r', encoding='utf-8') as f:
+    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
         return f.read()
 
 
-def generate_endpoint_table(spec: Dict[str, Any]) -> str:
-    """Generate markdown table of endpoints"""
-    endpoints = []
+def compute_input_digest() -> Optional[str]:
+    """Hash the generation inputs (spec + template).
+
+    Returns:
+        BLAKE2b hex digest of the input files, or None if they are missing.
+    """
+    if not SPEC_PATH.exists() or not TEMPLATE_PATH.exists():
+        return None
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(SPEC_PATH.read_bytes())
+    hasher.update(TEMPLATE_PATH.read_bytes())
+    return hasher.hexdigest()
+
+
+def _walk_paths(paths_items) -> Any:
+    """Yield (path, method_upper, details) for every documented operation.
+
+    Single traversal shared by all accumulators, so the paths are walked
+    exactly once regardless of how many sections are generated from them.
 
-    for path, methods in spec.get('paths', {}).items():
+    Args:
+        paths_items: Iterable of (path, methods_dict) pairs - either
+            spec['paths'].items() or an ijson streaming equivalent
+    """
+    for path, methods in paths_items:
         for method, details in methods.items():
-            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
-                summary = details.get('summary', path)
-                endpoints.append({
-                    'method': method.upper(),
-                    'path': path,
-                    'summary': summary
-                })
+            # FastAPI emits lowercase methods; the direct membership test
+            # skips the per-operation .lower() string allocation on that
+            # common path
+            if method in _HTTP_METHODS or method.lower() in _HTTP_METHODS:
+                yield path, method.upper(), details
+
+
+def analyze_paths(paths_items) -> tuple:
+    """Walk the paths once and build all derived data.
+
+    Args:
+        paths_items: Iterable of (path, methods_dict) pairs
+
+    Returns:
+        Tuple of (endpoints, response_info, count):
+        - endpoints: list of {'method', 'path', 'summary'} dicts
+        - response_info: dict mapping int response code to set of descriptions
+        - count: total number of endpoints
+    """
+    endpoints = []
+    # defaultdict: one hash lookup per insertion instead of a membership
+    # check followed by a second lookup
+    response_info: Dict[int, Set[str]] = defaultdict(set)
+    count = 0
+
+    # Bind hot attributes once; the inner loop is pure interpreter overhead
+    # and per-iteration attribute lookups dominate for large specs
+    endpoints_append = endpoints.append
+    no_responses: Dict[str, Any] = {}
+
+    for path, method, details in _walk_paths(paths_items):
+        count += 1
+        details_get = details.get
+        endpoints_append({
+            'method': method,
+            'path': path,
+            'summary': details_get('summary', path),
+        })
+
+        for code, response_details in details_get('responses', no_responses).items():
+            desc = response_details.get('description', 'No description')
+            # Int keys from the start: the numeric sort in the response-code
+            # section then compares ints in C with no key function
+            response_info[int(code)].add(desc)
+
+    return endpoints, dict(response_info), count
+
+
+def load_spec_data() -> tuple:
+    """Load the spec and extract only the data the README needs.
+
+    When ijson is installed, the spec is stream-parsed: only the 'info'
+    object and the per-path method dicts are materialized, so megabyte
+    specs never exist in memory as one dict. Otherwise the spec is fully
+    parsed and analyzed in a single pass.
+
+    Returns:
+        Tuple of (info, endpoints, response_info, count)
+    """
+    try:
+        import ijson
+    except ImportError:
+        spec = load_openapi_spec()
+        endpoints, response_info, count = analyze_paths(
+            spec.get('paths', {}).items()
+        )
+        return spec.get('info', {}), endpoints, response_info, count
+
+    if not SPEC_PATH.exists():
+        raise FileNotFoundError(
+            f"OpenAPI spec not found at {SPEC_PATH}. "
+            "Run the app to generate it first."
+        )
+
+    with open(SPEC_PATH, 'rb') as f:
+        info = next(ijson.items(f, 'info'), {})
+
+    with open(SPEC_PATH, 'rb') as f:
+        endpoints, response_info, count = analyze_paths(
+            ijson.kvitems(f, 'paths')
+        )
 
+    return info, endpoints, response_info, count
+
+
+def generate_endpoint_table(endpoints: list) -> str:
+    """Generate markdown table of endpoints"""
     # Sort endpoints: health first, then by path
     def sort_key(e):
         if e['path'] == '/health':
             return (0, '')
         return (1, e['path'])
 
-    endpoints.sort(key=sort_key)
-
-    # Build markdown table
-    table = "| Method | Endpoint | Description |\n"
-    table += "|--------|----------|-------------|\n"
-
-    for endpoint in endpoints:
-        table += f"| {endpoint['method']} | `{endpoint['path']}` | {endpoint['summary']} |\n"
+    endpoints = sorted(endpoints, key=sort_key)
 
-    return table
+    # Build markdown table via list + join (avoids quadratic string
+    # reallocation as the endpoint count grows)
+    rows = [
+        "| Method | Endpoint | Description |",
+        "|--------|----------|-------------|",
+    ]
+    rows.extend(
+        f"| {e['method']} | `{e['path']}` | {e['summary']} |" for e in endpoints
+    )
 
+    return "\n".join(rows) + "\n"
 
-def extract_response_codes(spec: Dict[str, Any]) -> Dict[str, Set[str]]:
-    """Extract unique response codes and their descriptions across all endpoints"""
-    response_info = {}
 
-    for path, methods in spec.get('paths', {}).items():
-        for method, details in methods.items():
-            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
-                for code, response_details in details.get('responses', {}).items():
-                    desc = response_details.get('description', 'No description')
-                    if code not in response_info:
-                        response_info[code] = set()
-                    response_info[code].add(desc)
+def generate_proxy_routes_table() -> str:
+    """Generate markdown table of gateway proxy routes"""
+    rows = [
+        "| Route Pattern | Backend Service | Port | Description |",
+        "|---------------|-----------------|------|-------------|",
+    ]
+    rows.extend(
+        f"| `{pattern}` | {service} | {port} | {description} |"
+        for pattern, service, port, description in _PROXY_ROUTES
+    )
 
-    return response_info
+    return "\n".join(rows) + "\n"
 
 
-def generate_response_codes_section(spec: Dict[str, Any]) -> str:
+def generate_response_codes_section(response_info: Dict[int, Set[str]]) -> str:
     """Generate response codes documentation"""
-    response_info = extract_response_codes(spec)
-
     if not response_info:
         return ""
 
-    section = "## Common Response Codes\n\n"
-
-    # Sort codes numerically
-    for code in sorted(response_info.keys(), key=lambda x: int(x)):
-        descriptions = list(response_info[code])
-        section += f"- **{code}**: {descriptions[0]}\n"
+    lines = ["## Common Response Codes", ""]
 
-    return section
+    # Codes are int keys, so plain sorted() compares them numerically
+    for code, descriptions in sorted(response_info.items()):
+        lines.append(f"- **{code}**: {next(iter(descriptions))}")
 
-
-def count_endpoints(spec: Dict[str, Any]) -> int:
-    """Count total number of endpoints"""
-    count = 0
-    for path, methods in spec.get('paths', {}).items():
-        for method in methods.keys():
-            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
-                count += 1
-    return count
+    return "\n".join(lines) + "\n"
 
 
 def generate_badge_line(total_endpoints: int, timestamp: str) -> str:
@@ -145,50 +274,88 @@ def generate_stats_footer(total_endpoints: int, timestamp: str, version: str) ->
 
 
 def inject_content(template: str, replacements: Dict[str, str]) -> str:
-    """Inject generated content into template placeholders"""
-    result = template
+    """Inject generated content into template placeholders.
 
-    for placeholder, content in replacements.items():
-        # Match <!-- GENERATED:PLACEHOLDER --> pattern
-        pattern = rf'<!-- GENERATED:{placeholder} -->'
-        result = re.sub(pattern, content, result)
-
-    return result
+    A single pass with one precompiled pattern replaces every
+    <!-- GENERATED:PLACEHOLDER --> marker, instead of rescanning the whole
+    template once per placeholder. Using a callback also keeps generated
+    content literal (no backreference/escape interpretation). Unknown
+    placeholders are left untouched.
+    """
+    return _PLACEHOLDER_RE.sub(
+        lambda match: replacements.get(match.group(1), match.group(0)),
+        template,
+    )
 
 
 def main():
     """Generate README.md by injecting dynamic content into template"""
+    parser = argparse.ArgumentParser(
+        description="Generate README.md from template + OpenAPI specification"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if spec and template are unchanged",
+    )
+    args = parser.parse_args()
+
+    # Skip regeneration when the inputs are byte-identical to the last run
+    digest = compute_input_digest()
+    if not args.force and digest and HASH_PATH.exists():
+        if HASH_PATH.read_text(encoding='utf-8').strip() == digest:
+            print("README.md is up to date (spec and template unchanged)")
+            return
+
     print("Generating README.md from template + OpenAPI specification...")
 
-    # Load inputs
-    spec = load_openapi_spec()
+    # Load inputs (single pass over the spec builds all derived data)
+    info, endpoints, response_info, total_endpoints = load_spec_data()
     template = load_template()
 
     # Extract metadata
-    info = spec.get('info', {})
     version = info.get('version', '1.0.0')
+    # Format fields directly instead of strftime (avoids locale machinery,
+    # and utcnow() is deprecated)
+    now = datetime.now(timezone.utc)
+    timestamp = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{now.hour:02d}:{now.minute:02d} UTC"
+    )
+
+    # The section renderers are independent pure functions; render them
+    # concurrently (matters once specs reach hundreds of endpoints)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        future_table = executor.submit(generate_endpoint_table, endpoints)
+        future_proxy = executor.submit(generate_proxy_routes_table)
+        future_codes = executor.submit(
+            generate_response_codes_section, response_info
+        )
 
-    # Generate dynamic content
-    total_endpoints = count_endpoints(spec)
-    timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')
-
-    replacements = {
-        'BADGE_LINE': generate_badge_line(total_endpoints, timestamp),
-        'API_TABLE': generate_endpoint_table(spec),
-        'RESPONSE_CODES': generate_response_codes_section(spec),
-        'STATS': generate_stats_footer(total_endpoints, timestamp, version),
-    }
+        replacements = {
+            'BADGE_LINE': generate_badge_line(total_endpoints, timestamp),
+            'STATS': generate_stats_footer(total_endpoints, timestamp, version),
+            'API_TABLE': future_table.result(),
+            'PROXY_ROUTES': future_proxy.result(),
+            'RESPONSE_CODES': future_codes.result(),
+        }
 
     # Inject into template
     readme_content = inject_content(template, replacements)
 
-    # Write README
-    readme_path = Path(__file__).parent.parent / "README.md"
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    # Write README atomically: a tempfile plus os.replace means readers never
+    # observe a partially written file, and write_bytes encodes once and
+    # writes in a single syscall
+    tmp_path = README_PATH.with_suffix('.md.tmp')
+    tmp_path.write_bytes(readme_content.encode('utf-8'))
+    os.replace(tmp_path, README_PATH)
+
+    # Record the input digest so unchanged inputs skip the next run
+    if digest:
+        HASH_PATH.write_text(digest + "\n", encoding='utf-8')
 
     print(f"README.md generated successfully")
-    print(f"   Location: {readme_path}")
+    print(f"   Location: {README_PATH}")
     print(f"   Total endpoints documented: {total_endpoints}")
     print(f"   Timestamp: {timestamp}")
     print(f"   Template: README_TEMPLATE.md")
@@ -1,6 +1,6 @@
 """API layer - Middleware and routing"""
 
-from .middleware import AuthMiddleware
+from .middleware import GatewayMiddleware
 from .routes import router
 
-__all__ = ["AuthMiddleware", "router"]
+__all__ = ["GatewayMiddleware", "router"]
@@ -1,10 +1,12 @@
 """Authentication and rate limiting middleware"""
 
+import hashlib
 import logging
-from typing import Callable
-from fastapi import Request, Response, status
+import re
+import time
+import jwt
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from ..core.auth_provider import IAuthProvider
 from ..core.user_context import UserContext
@@ -12,83 +14,174 @@ from ..core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Validated-token cache settings. JWTs are self-contained and reused for
+# their whole lifetime, so re-verifying the RSA signature on every request
+# is wasted crypto. Each entry's lifetime is the smaller of this TTL and
+# the token's own exp, so an expired token is never served from cache.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX_SIZE = 10000
 
-class AuthMiddleware(BaseHTTPMiddleware):
+# Public endpoint prefixes compiled into one C-level regex match instead of
+# a per-request list construction plus linear startswith scan
+_PUBLIC_PATH_RE = re.compile(
+    r"^/(?:health|api/v1/auth/(?:login|dev-login|register|dev-register|refresh))"
+)
+
+# The exact header names the gateway injects (see UserContext.to_headers).
+# Checked by hashed set membership; the x-user- prefix scan only runs as a
+# fallback for forged variants outside the known set.
+_USER_HEADER_NAMES = frozenset(
+    (b"x-user-id", b"x-user-email", b"x-user-roles", b"x-email-verified")
+)
+
+
+class GatewayMiddleware:
     """
-    Authentication middleware for JWT validation and header injection.
+    Fused rate limiting + authentication middleware.
+
+    Implemented as a single pure ASGI middleware (no BaseHTTPMiddleware):
+    Starlette's BaseHTTPMiddleware wraps every request in an extra task plus
+    a memory stream, and running rate limiting and auth as two separate
+    middlewares doubles that per-request hop. Fusing them means one
+    middleware call, one scope["path"] read, and one scope["headers"] scan
+    shared by the rate-limit (client IP) and auth (Authorization) checks.
+
+    Rate limiting:
+    - Per-IP limits via Redis or in-memory backend
+    - Graceful degradation (fail-open on errors)
+    - Standard HTTP headers (X-RateLimit-*)
+    - /health exempt (for K8s probes)
 
-    Security features:
-    1. Strips client-provided X-User-* headers (prevents header injection attacks)
-    2. Validates JWT tokens using configured auth provider
+    Authentication (runs after the rate-limit check, matching the previous
+    two-middleware dispatch order):
+    1. Strips client-provided X-User-* headers (prevents header injection)
+    2. Validates JWT tokens using the configured auth provider
     3. Adds validated X-User-* headers for downstream services
     4. Allows unauthenticated access to /health and /auth/* endpoints
     5. Supports optional authentication (if configured) for self-hosted mode
-
-    Flow:
-    1. Extract Authorization header
-    2. Validate JWT token via auth provider
-    3. Strip malicious client headers
-    4. Add validated user headers
-    5. Forward to backend service
     """
 
+    # One long-lived instance serves every request; slots drop the
+    # per-instance __dict__ and make each attribute access in __call__ a
+    # fixed-offset load instead of a dict probe
+    __slots__ = (
+        "app",
+        "auth_provider",
+        "settings",
+        "rate_limiter",
+        "auth_required",
+        "_token_cache",
+    )
+
     def __init__(self, app, auth_provider: IAuthProvider, settings=None):
         """
-        Initialize authentication middleware.
+        Initialize gateway middleware.
 
         Args:
-            app: FastAPI application
+            app: Downstream ASGI application
             auth_provider: Authentication provider implementation (IAuthProvider)
             settings: Application settings (optional)
         """
-        super().__init__(app)
+        self.app = app
         self.auth_provider = auth_provider
         self.settings = settings
-        
+        self.rate_limiter = get_rate_limiter()
+
+        # Cache of validated tokens: blake2b(token) -> (expires_at, UserContext)
+        self._token_cache: dict = {}
+
         # Determine auth mode
         self.auth_required = True
         if settings and hasattr(settings, "auth_required"):
             self.auth_required = settings.auth_required
-            
+
         logger.info(
-            f"Initialized AuthMiddleware with provider: {auth_provider.get_provider_name()}, "
-            f"Auth Required: {self.auth_required}"
+            "Initialized GatewayMiddleware with provider: %s, Auth Required: %s",
+            auth_provider.get_provider_name(),
+            self.auth_required,
         )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send) -> None:
         """
-        Process request with authentication validation.
+        Process request: rate limit check, then authentication.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            Response from downstream handler or 401 error
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Allow unauthenticated access to health and auth endpoints
-        if self._is_public_endpoint(request.url.path):
-            logger.debug(f"Public endpoint accessed: {request.url.path}")
-            return await call_next(request)
+        # Localize the downstream app; it's awaited on every exit path
+        app = self.app
+
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
+        # Health checks skip both rate limiting and auth (K8s probes)
+        if path == "/health":
+            await app(scope, receive, send)
+            return
+
+        # Strip client-provided X-User-* headers before anything else
+        # (security!): every request is proxied, including the public auth
+        # endpoints, so forged identity headers must never survive into the
+        # forward path regardless of whether this request authenticates
+        self._strip_client_user_headers(scope)
+
+        # Single pass over the raw headers for everything both checks need
+        # (ASGI header names are lowercase bytes)
+        auth_header = None
+        forwarded_for = None
+        real_ip = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+            elif name == b"x-forwarded-for":
+                forwarded_for = value.decode("latin-1")
+            elif name == b"x-real-ip":
+                real_ip = value.decode("latin-1")
+
+        # --- Rate limiting (runs before auth, as before) ---
+        client_ip = self._get_client_ip(scope, forwarded_for, real_ip)
+        is_allowed, rate_headers = await self.rate_limiter.is_allowed(client_ip)
 
-        # Extract Authorization header
-        auth_header = request.headers.get("Authorization")
+        if not is_allowed:
+            logger.warning("Rate limit exceeded for IP: %s", client_ip)
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "error": "rate_limit_exceeded",
+                    "message": "Too many requests. Please try again later.",
+                },
+                headers=rate_headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        # --- Authentication ---
         user_context = None
-        
+
+        if self._is_public_endpoint(path):
+            logger.debug("Public endpoint accessed: %s", path)
+
         # Case 1: No auth header provided
-        if not auth_header:
+        elif not auth_header:
             if self.auth_required:
-                logger.warning(f"Missing Authorization header for {request.url.path}")
-                return JSONResponse(
+                logger.warning("Missing Authorization header for %s", path)
+                response = JSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     content={
                         "error": "missing_authorization",
                         "message": "Authorization header is required",
                     },
                 )
+                await response(scope, receive, send)
+                return
             else:
                 # Auth is optional -> use anonymous user
-                logger.info(f"Allowing anonymous access to {request.url.path}")
+                logger.info("Allowing anonymous access to %s", path)
                 user_context = self._create_anonymous_user()
 
         # Case 2: Auth header provided
@@ -96,36 +189,99 @@ class AuthMiddleware(BaseHTTPMiddleware):
             # Extract token from "Bearer <token>"
             try:
                 token = self._extract_bearer_token(auth_header)
-                # Validate token and extract user context
-                user_context = await self.auth_provider.validate_token(token)
+                # Validate token and extract user context (cached by token
+                # hash so repeat requests skip the signature verification)
+                user_context = await self._validate_token_cached(token)
             except ValueError as e:
-                logger.warning(f"Token validation failed: {str(e)}")
-                return JSONResponse(
+                logger.warning("Token validation failed: %s", e)
+                response = JSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     content={
                         "error": "invalid_token",
                         "message": str(e),
                     },
                 )
+                await response(scope, receive, send)
+                return
 
-        # Strip client-provided X-User-* headers (security!)
-        self._strip_client_user_headers(request)
-
-        # Add validated user headers (from either token or anonymous context)
-        if user_context:
-            validated_headers = user_context.to_headers()
-            for header_name, header_value in validated_headers.items():
-                request.state.user_headers = getattr(request.state, "user_headers", {})
-                request.state.user_headers[header_name] = header_value
+        if user_context is not None:
+            # Add validated user headers (from either token or anonymous
+            # context) directly to the scope so downstream handlers forward
+            # them as-is. to_header_bytes is memoized per UserContext, so
+            # token-cache hits reuse the same pre-encoded tuples.
+            scope["headers"].extend(user_context.to_header_bytes())
 
             logger.info(
-                f"Authenticated user {user_context.user_id} for {request.method} "
-                f"{request.url.path}"
+                "Authenticated user %s for %s %s",
+                user_context.user_id,
+                scope["method"],
+                path,
             )
 
-        # Forward to next handler
-        response = await call_next(request)
-        return response
+        # Forward to next handler, attaching rate-limit headers on the way out
+        if rate_headers:
+            header_items = [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in rate_headers.items()
+            ]
+
+            async def send_with_headers(message) -> None:
+                if message["type"] == "http.response.start":
+                    message.setdefault("headers", []).extend(header_items)
+                await send(message)
+
+            await app(scope, receive, send_with_headers)
+        else:
+            await app(scope, receive, send)
+
+    async def _validate_token_cached(self, token: str) -> UserContext:
+        """
+        Validate a JWT token, reusing a recent validation result if present.
+
+        Tokens are keyed by a BLAKE2b digest (never the raw token) and cached
+        for min(_TOKEN_CACHE_TTL, time until the token's exp), so a token is
+        never accepted from cache past its own expiry. Only successful
+        validations are cached; failures always re-validate.
+
+        Args:
+            token: JWT token string (without "Bearer " prefix)
+
+        Returns:
+            UserContext for the validated token
+
+        Raises:
+            ValueError: If token is invalid, expired, or signature verification fails
+        """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.monotonic()
+
+        entry = self._token_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        user_context = await self.auth_provider.validate_token(token)
+
+        # Cap the entry at the token's own exp: the provider just verified
+        # the signature (and exp), so an unverified claims read is enough
+        # to bound the cache window and an expired token can never be
+        # honored, however short its remaining lifetime
+        ttl = _TOKEN_CACHE_TTL
+        try:
+            exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+            if exp is not None:
+                ttl = min(ttl, exp - time.time())
+        except jwt.InvalidTokenError:
+            ttl = 0.0
+        if ttl <= 0:
+            return user_context
+
+        # Bound memory: drop the cache wholesale if it fills up (entries are
+        # cheap to rebuild - one signature verification each)
+        if len(self._token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.clear()
+        self._token_cache[key] = (now + ttl, user_context)
+
+        return user_context
 
     def _create_anonymous_user(self) -> UserContext:
         """Create a default anonymous user context."""
@@ -165,15 +321,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             True if endpoint is public, False otherwise
         """
-        public_paths = [
-            "/health",
-            "/api/v1/auth/login",
-            "/api/v1/auth/dev-login",
-            "/api/v1/auth/register",
-            "/api/v1/auth/dev-register",
-            "/api/v1/auth/refresh",
-        ]
-        return any(path.startswith(prefix) for prefix in public_paths)
+        return _PUBLIC_PATH_RE.match(path) is not None
 
     def _extract_bearer_token(self, auth_header: str) -> str:
         """
@@ -190,6 +338,16 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Raises:
             ValueError: If header format is invalid
         """
+        # Fast path for the well-formed common case: exact prefix compare,
+        # falling back to a lowercase compare only for unusual casing. No
+        # list allocation from split().
+        if len(auth_header) > 7 and (
+            auth_header[:7] == "Bearer " or auth_header[:7].lower() == "bearer "
+        ):
+            token = auth_header[7:].strip()
+            if token and " " not in token:
+                return token
+
         parts = auth_header.split()
         if len(parts) != 2:
             raise ValueError("Authorization header must be 'Bearer <token>'")
@@ -200,126 +358,67 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         return token
 
-    def _strip_client_user_headers(self, request: Request) -> None:
+    def _strip_client_user_headers(self, scope) -> None:
         """
         Remove any client-provided X-User-* headers (security measure).
 
         This prevents header injection attacks where a malicious client
-        sends forged X-User-ID or X-User-Email headers.
+        sends forged X-User-ID or X-User-Email headers. The headers are
+        removed from scope["headers"] in place, so the request downstream
+        handlers (and proxied backends) see never contains them.
 
         Args:
-            request: Incoming request
+            scope: ASGI connection scope
         """
-        # Get mutable headers
-        headers = dict(request.headers)
-
-        # Remove X-User-* headers
+        headers = scope["headers"]
         headers_to_remove = [
-            key for key in headers.keys() if key.lower().startswith("x-user-")
+            name for name, _ in headers
+            if name in _USER_HEADER_NAMES or name.startswith(b"x-user-")
         ]
 
-        for header in headers_to_remove:
-            logger.debug(f"Stripped client-provided header: {header}")
-            # Note: request.headers is immutable, but we track this for logging
-            # The actual stripping happens by not forwarding these headers
-
         if headers_to_remove:
+            scope["headers"] = [
+                (name, value)
+                for name, value in headers
+                if name not in _USER_HEADER_NAMES
+                and not name.startswith(b"x-user-")
+            ]
             logger.warning(
-                f"Client attempted header injection with: {headers_to_remove}"
-            )
-
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """
-    Rate limiting middleware using Redis or in-memory backend.
-
-    Features:
-    - Per-IP rate limiting
-    - Redis-backed (distributed across gateway pods)
-    - In-memory fallback (if Redis unavailable)
-    - Graceful degradation (fail-open on errors)
-    - Standard HTTP headers (X-RateLimit-*)
-
-    Exemptions:
-    - /health endpoint (for K8s probes)
-    """
-
-    def __init__(self, app):
-        """Initialize rate limit middleware."""
-        super().__init__(app)
-        self.rate_limiter = get_rate_limiter()
-        logger.info("Initialized RateLimitMiddleware")
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Check rate limit before processing request.
-
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            Response or 429 Too Many Requests
-        """
-        # Skip rate limiting for health checks
-        if request.url.path == "/health":
-            return await call_next(request)
-
-        # Get client identifier (IP address)
-        client_ip = self._get_client_ip(request)
-
-        # Check rate limit
-        is_allowed, headers = self.rate_limiter.is_allowed(client_ip)
-
-        if not is_allowed:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "error": "rate_limit_exceeded",
-                    "message": "Too many requests. Please try again later.",
-                },
-                headers=headers,
+                "Client attempted header injection with: %s", headers_to_remove
             )
 
-        # Continue to next handler
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        for header_name, header_value in headers.items():
-            response.headers[header_name] = header_value
-
-        return response
-
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope, forwarded_for, real_ip) -> str:
         """
-        Extract client IP address from request.
+        Resolve the client IP from pre-scanned headers or the connection.
 
         Checks in order:
         1. X-Forwarded-For (if behind proxy/load balancer)
         2. X-Real-IP (nginx)
-        3. request.client.host (direct connection)
+        3. scope["client"] (direct connection)
 
         Args:
-            request: Incoming request
+            scope: ASGI connection scope
+            forwarded_for: X-Forwarded-For header value (or None)
+            real_ip: X-Real-IP header value (or None)
 
         Returns:
             Client IP address
         """
         # Check X-Forwarded-For (load balancer)
-        forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
-            # Take first IP (client)
-            return forwarded_for.split(",")[0].strip()
+            # Take first IP (client); partition avoids building a list of
+            # the whole hop chain just to index its first element
+            head, _, _ = forwarded_for.partition(",")
+            return head.strip()
 
         # Check X-Real-IP (nginx)
-        real_ip = request.headers.get("X-Real-IP")
         if real_ip:
             return real_ip
 
         # Direct connection
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         # Fallback
         return "unknown"
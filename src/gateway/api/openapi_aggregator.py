@@ -15,8 +15,12 @@ Benefits:
 - Better developer experience
 """
 
+import asyncio
+import gzip
 import httpx
 import logging
+import orjson
+import time
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
 
@@ -38,7 +42,39 @@ class OpenAPIAggregator:
         self.services = services
         self.cache_ttl = cache_ttl
         self._cached_spec: Optional[Dict[str, Any]] = None
+        # Spec serialized once at cache-population time, so /openapi.json
+        # hits don't re-encode the whole document per request
+        self._cached_spec_bytes: Optional[bytes] = None
+        # Gzipped once per cache refresh; serving it costs zero CPU per
+        # request and cuts the wire size of the JSON spec by roughly 10x
+        self._cached_spec_gz: Optional[bytes] = None
         self._cache_timestamp: Optional[float] = None
+        # Single-flight: one coroutine refreshes while the rest await it
+        self._refresh_lock = asyncio.Lock()
+        # Long-lived HTTP client (lifespan-managed); keep-alive connections
+        # to the services survive across cache refreshes
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def startup(self) -> None:
+        """Create the pooled HTTP client (call from the app lifespan)."""
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def shutdown(self) -> None:
+        """Close the pooled HTTP client (call from the app lifespan)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Build the pooled client used for all spec fetches."""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=len(self.services),
+                max_connections=max(len(self.services), 1) * 2,
+            ),
+        )
 
     async def get_unified_spec(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -53,11 +89,67 @@ class OpenAPIAggregator:
         Raises:
             HTTPException: If all services fail to respond
         """
-        # Check cache
-        if not force_refresh and self._cached_spec:
+        # Check cache (lock-free fast path)
+        if not force_refresh and self._is_cache_fresh():
             logger.debug("Returning cached unified OpenAPI spec")
             return self._cached_spec
 
+        # Only one coroutine refreshes; concurrent callers await and reuse
+        # its result instead of all hammering the services after expiry
+        async with self._refresh_lock:
+            if not force_refresh and self._is_cache_fresh():
+                return self._cached_spec
+            return await self._refresh_spec()
+
+    async def get_unified_spec_bytes(self, force_refresh: bool = False) -> bytes:
+        """
+        Get the unified spec pre-serialized as JSON bytes.
+
+        Serving these bytes directly avoids re-serializing the dict on every
+        /openapi.json request; the dict-returning get_unified_spec remains
+        for programmatic callers.
+
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh specs
+
+        Returns:
+            Unified OpenAPI specification as UTF-8 JSON bytes
+
+        Raises:
+            HTTPException: If all services fail to respond
+        """
+        await self.get_unified_spec(force_refresh=force_refresh)
+        return self._cached_spec_bytes
+
+    async def get_unified_spec_gzip(self, force_refresh: bool = False) -> bytes:
+        """
+        Get the unified spec pre-compressed as gzipped JSON bytes.
+
+        Compressed once at cache-population time, so gzip-capable clients
+        get the ~10x smaller body with no per-request compression cost.
+
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh specs
+
+        Returns:
+            Unified OpenAPI specification as gzipped UTF-8 JSON bytes
+
+        Raises:
+            HTTPException: If all services fail to respond
+        """
+        await self.get_unified_spec(force_refresh=force_refresh)
+        return self._cached_spec_gz
+
+    def _is_cache_fresh(self) -> bool:
+        """Check whether the cached spec exists and is within its TTL."""
+        return (
+            self._cached_spec is not None
+            and self._cache_timestamp is not None
+            and (time.monotonic() - self._cache_timestamp) < self.cache_ttl
+        )
+
+    async def _refresh_spec(self) -> Dict[str, Any]:
+        """Fetch specs from all services and rebuild the unified spec."""
         logger.info("Fetching OpenAPI specs from all microservices")
 
         # Initialize unified spec structure
@@ -112,86 +204,44 @@ class OpenAPIAggregator:
         successful_services = []
         failed_services = []
 
-        # Fetch specs from each service
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for service_name, service_url in self.services.items():
-                try:
-                    logger.debug(f"Fetching OpenAPI spec from {service_name} at {service_url}")
-                    response = await client.get(f"{service_url}/openapi.json")
-                    response.raise_for_status()
-                    service_spec = response.json()
-
-                    # Merge paths
-                    paths = service_spec.get("paths", {})
-                    unified_spec["paths"].update(paths)
-                    logger.debug(f"Merged {len(paths)} paths from {service_name}")
-
-                    # Merge components
-                    components = service_spec.get("components", {})
-
-                    # Merge schemas
-                    schemas = components.get("schemas", {})
-                    unified_spec["components"]["schemas"].update(schemas)
-
-                    # Merge security schemes
-                    security = components.get("securitySchemes", {})
-                    unified_spec["components"]["securitySchemes"].update(security)
-
-                    # Merge responses
-                    responses = components.get("responses", {})
-                    unified_spec["components"]["responses"].update(responses)
-
-                    # Merge parameters
-                    parameters = components.get("parameters", {})
-                    unified_spec["components"]["parameters"].update(parameters)
-
-                    # Merge request bodies
-                    request_bodies = components.get("requestBodies", {})
-                    unified_spec["components"]["requestBodies"].update(request_bodies)
-
-                    # Merge tags (avoid duplicates)
-                    tags = service_spec.get("tags", [])
-                    existing_tag_names = {tag["name"] for tag in unified_spec["tags"]}
-                    for tag in tags:
-                        if tag["name"] not in existing_tag_names:
-                            unified_spec["tags"].append(tag)
-                            existing_tag_names.add(tag["name"])
-
-                    successful_services.append(service_name)
-                    logger.info(f"✓ Successfully merged OpenAPI spec from {service_name}")
-
-                except httpx.HTTPStatusError as e:
-                    logger.warning(
-                        f"✗ HTTP error fetching OpenAPI spec from {service_name}: "
-                        f"{e.response.status_code}"
-                    )
-                    failed_services.append(service_name)
-
-                except httpx.TimeoutException:
-                    logger.warning(f"✗ Timeout fetching OpenAPI spec from {service_name}")
-                    failed_services.append(service_name)
-
-                except httpx.RequestError as e:
-                    logger.warning(
-                        f"✗ Request error fetching OpenAPI spec from {service_name}: {str(e)}"
-                    )
-                    failed_services.append(service_name)
-
-                except Exception as e:
-                    logger.error(
-                        f"✗ Unexpected error fetching OpenAPI spec from {service_name}: {str(e)}"
-                    )
-                    failed_services.append(service_name)
+        # Fetch specs from all services concurrently - wall time is the
+        # slowest service instead of the sum of all round trips. The pooled
+        # client is created lazily if the lifespan hook has not run (tests).
+        if self._client is None:
+            self._client = self._create_client()
+
+        results = await asyncio.gather(
+            *(
+                self._fetch_one(self._client, service_name, service_url)
+                for service_name, service_url in self.services.items()
+            )
+        )
+
+        # Merge sequentially (dict merging is CPU-bound and must stay serial).
+        # One tag-name set is maintained across all services instead of
+        # being rebuilt from the merged tag list per service.
+        seen_tag_names: set = set()
+        for service_name, service_spec in results:
+            if service_spec is None:
+                failed_services.append(service_name)
+                continue
+
+            self._merge_service_spec(
+                unified_spec, service_name, service_spec, seen_tag_names
+            )
+            successful_services.append(service_name)
+            logger.info("✓ Successfully merged OpenAPI spec from %s", service_name)
 
         # Log summary
         logger.info(
-            f"OpenAPI aggregation complete: {len(successful_services)} successful, "
-            f"{len(failed_services)} failed"
+            "OpenAPI aggregation complete: %d successful, %d failed",
+            len(successful_services),
+            len(failed_services),
         )
         if successful_services:
-            logger.info(f"  ✓ Successful: {', '.join(successful_services)}")
+            logger.info("  ✓ Successful: %s", ", ".join(successful_services))
         if failed_services:
-            logger.warning(f"  ✗ Failed: {', '.join(failed_services)}")
+            logger.warning("  ✗ Failed: %s", ", ".join(failed_services))
 
         # If ALL services failed, raise error
         if not successful_services:
@@ -211,16 +261,112 @@ class OpenAPIAggregator:
             "total_schemas": len(unified_spec["components"]["schemas"]),
         }
 
-        # Cache the result
+        # Cache the result, serialized once for the /openapi.json hot path
         self._cached_spec = unified_spec
+        self._cached_spec_bytes = orjson.dumps(unified_spec)
+        self._cached_spec_gz = gzip.compress(self._cached_spec_bytes, compresslevel=6)
+        self._cache_timestamp = time.monotonic()
         logger.info(
-            f"Cached unified spec: {len(unified_spec['paths'])} paths, "
-            f"{len(unified_spec['components']['schemas'])} schemas"
+            "Cached unified spec: %d paths, %d schemas",
+            len(unified_spec["paths"]),
+            len(unified_spec["components"]["schemas"]),
         )
 
         return unified_spec
 
+    async def _fetch_one(
+        self, client: httpx.AsyncClient, service_name: str, service_url: str
+    ) -> tuple:
+        """
+        Fetch the OpenAPI spec from a single service.
+
+        Args:
+            client: Shared HTTP client
+            service_name: Service identifier (e.g., "auth")
+            service_url: Service base URL
+
+        Returns:
+            Tuple of (service_name, spec dict) on success, or
+            (service_name, None) on any fetch error
+        """
+        try:
+            logger.debug(
+                "Fetching OpenAPI spec from %s at %s", service_name, service_url
+            )
+            response = await client.get(f"{service_url}/openapi.json")
+            response.raise_for_status()
+            return service_name, orjson.loads(response.content)
+
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                "✗ HTTP error fetching OpenAPI spec from %s: %d",
+                service_name,
+                e.response.status_code,
+            )
+
+        except httpx.TimeoutException:
+            logger.warning("✗ Timeout fetching OpenAPI spec from %s", service_name)
+
+        except httpx.RequestError as e:
+            logger.warning(
+                "✗ Request error fetching OpenAPI spec from %s: %s", service_name, e
+            )
+
+        except Exception as e:
+            logger.error(
+                "✗ Unexpected error fetching OpenAPI spec from %s: %s", service_name, e
+            )
+
+        return service_name, None
+
+    def _merge_service_spec(
+        self,
+        unified_spec: Dict[str, Any],
+        service_name: str,
+        service_spec: Dict[str, Any],
+        seen_tag_names: set,
+    ) -> None:
+        """
+        Merge a single service spec into the unified spec.
+
+        Args:
+            unified_spec: Unified spec being built (mutated in place)
+            service_name: Service identifier (for logging)
+            service_spec: The service's OpenAPI spec
+            seen_tag_names: Tag names merged so far (mutated in place)
+        """
+        # Merge paths
+        paths = service_spec.get("paths", {})
+        unified_spec["paths"].update(paths)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Merged %d paths from %s", len(paths), service_name)
+
+        # Merge components
+        components = service_spec.get("components", {})
+        unified_components = unified_spec["components"]
+        unified_components["schemas"].update(components.get("schemas", {}))
+        unified_components["securitySchemes"].update(
+            components.get("securitySchemes", {})
+        )
+        unified_components["responses"].update(components.get("responses", {}))
+        unified_components["parameters"].update(components.get("parameters", {}))
+        unified_components["requestBodies"].update(
+            components.get("requestBodies", {})
+        )
+
+        # Merge tags (avoid duplicates)
+        add_tag_name = seen_tag_names.add
+        append_tag = unified_spec["tags"].append
+        for tag in service_spec.get("tags", []):
+            name = tag["name"]
+            if name not in seen_tag_names:
+                append_tag(tag)
+                add_tag_name(name)
+
     def clear_cache(self) -> None:
         """Clear the cached OpenAPI specification"""
         self._cached_spec = None
+        self._cached_spec_bytes = None
+        self._cached_spec_gz = None
+        self._cache_timestamp = None
         logger.info("OpenAPI spec cache cleared")
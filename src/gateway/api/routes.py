@@ -1,25 +1,171 @@
 """API routes for health checks and service proxying"""
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
 from typing import Any, Dict
+from urllib.parse import urlparse
 import httpx
+import orjson
 from fastapi import APIRouter, Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
-from ..core.circuit_breaker import get_circuit_breaker
+from ..core.circuit_breaker import CircuitState, get_circuit_breaker
 from ..core.health_checker import get_health_checker
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Hop-by-hop headers (RFC 9110 §7.6.1) plus host, which httpx sets itself.
+# These apply to a single transport link and must not be forwarded.
+_HOP_BY_HOP = frozenset((
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+))
+
+# Same set as bytes, for filtering backend response headers without
+# decoding them (httpx exposes the raw header pairs as bytes)
+_HOP_BY_HOP_BYTES = frozenset(name.encode("latin-1") for name in _HOP_BY_HOP)
+
+# Optimistic fast path: the header names that appear on virtually every
+# request and are always forwarded. A hit in this small set (bytes hashes
+# are cached after first use) skips the lower() + hop-by-hop probe.
+_COMMON_REQUEST_HEADERS = frozenset((
+    b"accept",
+    b"accept-encoding",
+    b"accept-language",
+    b"authorization",
+    b"content-type",
+    b"content-length",
+    b"user-agent",
+    b"x-user-id",
+    b"x-user-email",
+    b"x-user-roles",
+    b"x-email-verified",
+))
+
+# Short-TTL cache of successful GET responses, keyed per user so one
+# user's data is never served to another. Repeat identical reads within
+# the window skip the backend round-trip entirely, and entries double as
+# a stale fallback when a service's circuit breaker is open.
+# key -> (expires_at, status_code, raw_headers, body)
+_RESPONSE_CACHE_TTL = 5.0
+_RESPONSE_CACHE_MAX_SIZE = 1000
+_response_cache: dict = {}
+
+# Single-flight coalescing for concurrent identical GETs: the first
+# request registers a Future under its cache key and later arrivals await
+# it, so N simultaneous reads of one resource cost one backend call.
+_inflight: dict = {}
+
+# Only small JSON bodies are buffered into the response cache. Anything
+# larger, of another content type, marked uncacheable by the backend, or
+# without a declared length (chunked transfers, SSE streams) keeps the
+# constant-memory streaming path.
+_CACHEABLE_MAX_BYTES = 64 * 1024
+
+
+def _is_cacheable_response(backend_response) -> bool:
+    """Decide whether a 2xx GET response is safe to buffer and cache."""
+    headers = backend_response.headers
+
+    content_type = headers.get("content-type", "")
+    if not (
+        content_type.startswith("application/json")
+        or content_type.partition(";")[0].endswith("+json")
+    ):
+        return False
+
+    cache_control = headers.get("cache-control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control or "private" in cache_control:
+        return False
+
+    content_length = headers.get("content-length")
+    if content_length is None:
+        return False
+    try:
+        return int(content_length) <= _CACHEABLE_MAX_BYTES
+    except ValueError:
+        return False
+
+
+# Short-TTL cache over circuit_breaker.is_call_allowed so the common
+# CLOSED state skips the breaker's lock on the hot path. Only CLOSED
+# admissions (trusted for 1s) and OPEN rejections (0.2s, so recovery via
+# HALF_OPEN still begins promptly) are cached; HALF_OPEN verdicts are
+# never cached, since each admission there grants one bounded probe slot
+# and replaying it would wave the whole herd through uncounted.
+_ALLOW_CACHE_TTL_ALLOWED = 1.0
+_ALLOW_CACHE_TTL_DENIED = 0.2
+_allow_cache: dict = {}
+
+
+def _is_call_allowed_cached(service_name: str) -> bool:
+    """Check the circuit breaker through a short-TTL local cache."""
+    now = time.monotonic()
+    entry = _allow_cache.get(service_name)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    allowed = circuit_breaker.is_call_allowed(service_name)
+    state = circuit_breaker.get_state(service_name)
+    if state is CircuitState.CLOSED:
+        _allow_cache[service_name] = (allowed, now + _ALLOW_CACHE_TTL_ALLOWED)
+    elif state is CircuitState.OPEN and not allowed:
+        _allow_cache[service_name] = (False, now + _ALLOW_CACHE_TTL_DENIED)
+    else:
+        # HALF_OPEN (including an OPEN -> HALF_OPEN admission just made by
+        # is_call_allowed): every check must reach the breaker so probe
+        # admission stays bounded by half_open_max_calls
+        _allow_cache.pop(service_name, None)
+    return allowed
+
+
+def _response_cache_key(service_name: str, request: Request, path: str) -> tuple:
+    """Build the response-cache key for a GET request."""
+    return (
+        service_name,
+        path,
+        request.url.query,
+        request.headers.get("x-user-id", ""),
+    )
+
+
+def _cached_response(entry: tuple, stale: bool = False) -> Response:
+    """Rebuild a Response from a cache entry."""
+    response = Response(content=entry[3], status_code=entry[1])
+    response.raw_headers = list(entry[2])
+    if stale:
+        response.headers["X-From-Stale-Cache"] = "true"
+    return response
+
 # Initialize circuit breaker and health checker
 circuit_breaker = get_circuit_breaker()
 health_checker = get_health_checker()
 
+# The /health payload never changes at runtime; serialize it once so the
+# probe path (polled every few seconds per pod) costs zero serialization
+_HEALTH_BYTES = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "fm-api-gateway",
+        "version": "1.0.0",
+    }
+)
+
 
 @router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Basic health check endpoint for API Gateway.
 
@@ -41,8 +187,9 @@ async def health_check() -> Dict[str, Any]:
     traffic before marking it as ready.
 
     Returns:
-        Dict with status="healthy", service name, and version number.
-        Always returns 200 OK unless the process is completely down.
+        Static payload with status="healthy", service name, and version
+        number, served as precomputed bytes. Always returns 200 OK unless
+        the process is completely down.
 
     Example Response:
         {
@@ -51,11 +198,7 @@ async def health_check() -> Dict[str, Any]:
             "version": "1.0.0"
         }
     """
-    return {
-        "status": "healthy",
-        "service": "fm-api-gateway",
-        "version": "1.0.0",
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/health/live")
@@ -93,7 +236,7 @@ async def readiness_probe() -> Response:
     # Return 503 if not ready (K8s will remove from service)
     status_code = status.HTTP_200_OK if health.ready else status.HTTP_503_SERVICE_UNAVAILABLE
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=health.to_dict(),
     )
@@ -103,6 +246,7 @@ async def proxy_request(
     request: Request,
     backend_url: str,
     path: str,
+    service_name: str = None,
 ) -> Response:
     """
     Proxy request to backend service with validated user headers.
@@ -110,8 +254,8 @@ async def proxy_request(
     This function:
     1. Checks circuit breaker status
     2. Forwards the request to the backend service
-    3. Adds validated X-User-* headers from middleware
-    4. Preserves original request method, body, and headers
+    3. Forwards validated X-User-* headers injected by GatewayMiddleware
+    4. Streams request and response bodies (constant memory per request)
     5. Records success/failure for circuit breaker
     6. Returns backend response to client
 
@@ -119,17 +263,38 @@ async def proxy_request(
         request: Original FastAPI request
         backend_url: Backend service base URL (e.g., http://fm-auth-service:8000)
         path: Request path to append to backend URL
+        service_name: Pre-resolved service name; derived from backend_url
+            when omitted (route closures bake it in at registration time)
 
     Returns:
         Response from backend service or circuit breaker error
     """
-    # Extract service name from backend URL
-    service_name = _extract_service_name(backend_url)
-
-    # Check circuit breaker
-    if not circuit_breaker.is_call_allowed(service_name):
-        logger.error(f"Circuit breaker OPEN for {service_name}, rejecting request")
-        return JSONResponse(
+    if service_name is None:
+        service_name = extract_service_name(backend_url)
+
+    # Response cache applies to GETs only (idempotent, body-free)
+    cache_key = None
+    inflight_future = None
+    if request.method == "GET":
+        cache_key = _response_cache_key(service_name, request, path)
+        entry = _response_cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return _cached_response(entry)
+
+    # Check circuit breaker (via the short-TTL verdict cache)
+    if not _is_call_allowed_cached(service_name):
+        # Serve a stale cached read if we have one - degraded but useful
+        # while the backend recovers
+        if cache_key is not None:
+            entry = _response_cache.get(cache_key)
+            if entry is not None:
+                logger.warning(
+                    "Circuit breaker OPEN for %s, serving stale cache", service_name
+                )
+                return _cached_response(entry, stale=True)
+
+        logger.error("Circuit breaker OPEN for %s, rejecting request", service_name)
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "error": "service_unavailable",
@@ -137,74 +302,150 @@ async def proxy_request(
             },
         )
 
-    # Build target URL
-    target_url = f"{backend_url.rstrip('/')}{path}"
-
-    # Get request body
-    body = await request.body()
-
-    # Build headers
-    headers = dict(request.headers)
-
-    # Remove hop-by-hop headers
-    hop_by_hop_headers = [
-        "connection",
-        "keep-alive",
-        "proxy-authenticate",
-        "proxy-authorization",
-        "te",
-        "trailers",
-        "transfer-encoding",
-        "upgrade",
-        "host",  # Will be set by httpx
+    # Single-flight: if an identical GET is already in flight, await its
+    # result instead of issuing a duplicate backend call; otherwise become
+    # the leader other arrivals will wait on
+    if cache_key is not None:
+        existing = _inflight.get(cache_key)
+        if existing is not None:
+            entry = await existing
+            if entry is not None:
+                return _cached_response(entry)
+            # Leader failed to produce a cacheable result; fall through
+            # and issue our own request
+        else:
+            inflight_future = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = inflight_future
+
+    # Build target URL (backend_url comes from settings pre-stripped of
+    # any trailing slash). The query string rides along: the cache key
+    # already distinguishes queries, so the backend must see them too.
+    query = request.url.query
+    if query:
+        path = f"{path}?{query}"
+    target_url = backend_url + path
+
+    # Build forwarded headers in one pass over the raw (bytes, bytes)
+    # pairs, dropping hop-by-hop headers as we go - no dict build and no
+    # bytes-to-str decode per header. ASGI servers hand us header names
+    # already lowercased, so no per-header lower() is needed on this side
+    # (backend response headers keep their casing and are lowered there).
+    # The validated X-User-* headers were injected into the scope by
+    # GatewayMiddleware, so they are already part of this list.
+    headers = [
+        (name, value)
+        for name, value in request.headers.raw
+        if name in _COMMON_REQUEST_HEADERS
+        or name not in _HOP_BY_HOP_BYTES
     ]
-    for header in hop_by_hop_headers:
-        headers.pop(header, None)
-
-    # Add validated user headers from middleware
-    if hasattr(request.state, "user_headers"):
-        headers.update(request.state.user_headers)
-        logger.debug(f"Added validated user headers: {request.state.user_headers}")
 
-    # Make request to backend
+    # Make request to backend over the long-lived pooled clients (created
+    # in the app lifespan) so proxied calls reuse keep-alive connections
+    # instead of paying a TCP+TLS handshake each time. The per-backend
+    # HTTP/2 client is preferred (requests multiplex over one connection);
+    # the shared pool is the fallback for unregistered backends.
     try:
-        async with httpx.AsyncClient() as client:
-            backend_response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                timeout=30.0,
+        client = request.app.state.backend_clients.get(service_name)
+        if client is not None:
+            # base_url is set on per-backend clients; pass the path only
+            backend_request = client.build_request(
+                request.method, path, headers=headers, content=request.stream()
+            )
+        else:
+            client = request.app.state.backend_client
+            backend_request = client.build_request(
+                request.method, target_url, headers=headers, content=request.stream()
             )
 
+        # Stream both directions: the upload body is forwarded chunk by
+        # chunk and the response flows straight through, so memory stays
+        # O(chunk) instead of O(body) and first byte isn't delayed until
+        # the backend finishes
+        backend_response = await client.send(backend_request, stream=True)
+
         logger.info(
-            f"Proxied {request.method} {path} to {backend_url} "
-            f"-> {backend_response.status_code}"
+            "Proxied %s %s to %s -> %d",
+            request.method,
+            path,
+            backend_url,
+            backend_response.status_code,
         )
 
-        # Record success/failure for circuit breaker
+        # Record success/failure for circuit breaker as soon as the status
+        # is known (headers received), not after the full body
         if 200 <= backend_response.status_code < 500:
             # 2xx, 3xx, 4xx = success (service is healthy, just client error)
-            circuit_breaker.record_success(service_name)
+            circuit_breaker.record_async(service_name, True)
         else:
             # 5xx = service failure
-            circuit_breaker.record_failure(service_name)
+            circuit_breaker.record_async(service_name, False)
             logger.warning(
-                f"Service {service_name} returned {backend_response.status_code}, "
-                f"recording circuit breaker failure"
+                "Service %s returned %d, recording circuit breaker failure",
+                service_name,
+                backend_response.status_code,
             )
 
-        # Return backend response
-        return Response(
-            content=backend_response.content,
+        # Headers are forwarded as the raw bytes pairs httpx already holds,
+        # filtered for hop-by-hop in one pass with no dict build or
+        # decode/encode round-trip
+        out_headers = [
+            (name, value)
+            for name, value in backend_response.headers.raw
+            if name.lower() not in _HOP_BY_HOP_BYTES
+        ]
+
+        # Cacheable GET: buffer the small JSON body so repeat reads within
+        # the TTL skip the backend entirely. Large bodies, non-JSON content
+        # and undeclared lengths stream through untouched - buffering them
+        # would trade the constant-memory path for unbounded cache bytes
+        # (and an SSE stream would never return a byte until it ended).
+        if (
+            cache_key is not None
+            and 200 <= backend_response.status_code < 300
+            and _is_cacheable_response(backend_response)
+        ):
+            cached_body = await backend_response.aread()
+            await backend_response.aclose()
+            # aread() returns the content-decoded body (httpx transparently
+            # decompresses), so the backend's content-encoding and
+            # content-length no longer describe these bytes. Drop them and
+            # record the decoded length, otherwise replays of a gzipped
+            # backend response would claim an encoding the body doesn't have.
+            cache_headers = [
+                (name, value)
+                for name, value in out_headers
+                if name.lower() not in (b"content-encoding", b"content-length")
+            ]
+            cache_headers.append(
+                (b"content-length", str(len(cached_body)).encode("latin-1"))
+            )
+            if len(_response_cache) >= _RESPONSE_CACHE_MAX_SIZE:
+                _response_cache.clear()
+            entry = (
+                time.monotonic() + _RESPONSE_CACHE_TTL,
+                backend_response.status_code,
+                cache_headers,
+                cached_body,
+            )
+            _response_cache[cache_key] = entry
+            if inflight_future is not None and not inflight_future.done():
+                inflight_future.set_result(entry)
+            return _cached_response(entry)
+
+        # Stream backend response to client; aclose releases the pooled
+        # connection once the body has been fully forwarded
+        response = StreamingResponse(
+            backend_response.aiter_raw(),
             status_code=backend_response.status_code,
-            headers=dict(backend_response.headers),
+            background=BackgroundTask(backend_response.aclose),
         )
+        response.raw_headers = out_headers
+        return response
 
     except httpx.TimeoutException:
-        circuit_breaker.record_failure(service_name)
-        logger.error(f"Backend timeout for {target_url}")
-        return JSONResponse(
+        circuit_breaker.record_async(service_name, False)
+        logger.error("Backend timeout for %s", target_url)
+        return ORJSONResponse(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             content={
                 "error": "backend_timeout",
@@ -213,9 +454,9 @@ async def proxy_request(
         )
 
     except httpx.RequestError as e:
-        circuit_breaker.record_failure(service_name)
-        logger.error(f"Backend request error for {target_url}: {str(e)}")
-        return JSONResponse(
+        circuit_breaker.record_async(service_name, False)
+        logger.error("Backend request error for %s: %s", target_url, e)
+        return ORJSONResponse(
             status_code=status.HTTP_502_BAD_GATEWAY,
             content={
                 "error": "backend_error",
@@ -224,9 +465,9 @@ async def proxy_request(
         )
 
     except Exception as e:
-        circuit_breaker.record_failure(service_name)
-        logger.error(f"Unexpected error proxying to {target_url}: {str(e)}")
-        return JSONResponse(
+        circuit_breaker.record_async(service_name, False)
+        logger.error("Unexpected error proxying to %s: %s", target_url, e)
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "proxy_error",
@@ -234,11 +475,23 @@ async def proxy_request(
             },
         )
 
+    finally:
+        # Release any single-flight waiters; a None result tells them the
+        # leader produced nothing cacheable and they should fetch themselves
+        if inflight_future is not None:
+            _inflight.pop(cache_key, None)
+            if not inflight_future.done():
+                inflight_future.set_result(None)
+
 
-def _extract_service_name(backend_url: str) -> str:
+@lru_cache(maxsize=32)
+def extract_service_name(backend_url: str) -> str:
     """
     Extract service name from backend URL.
 
+    Cached: backend URLs come from a small fixed set of configured service
+    URLs, so after warm-up this is a dict hit instead of a URL parse.
+
     Examples:
         http://fm-auth-service:8000 -> fm-auth-service
         http://fm-knowledge-service.faultmaven.svc.cluster.local:8003 -> fm-knowledge-service
@@ -251,7 +504,6 @@ def _extract_service_name(backend_url: str) -> str:
         Service name
     """
     # Parse URL to get hostname
-    from urllib.parse import urlparse
     parsed = urlparse(backend_url)
     hostname = parsed.hostname or "unknown"
 
@@ -1,5 +1,6 @@
 """Gateway configuration using pydantic-settings"""
 
+from functools import cached_property, lru_cache
 from typing import Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -62,32 +63,50 @@ class Settings(BaseSettings):
     # Service Registry instance (lazy-initialized)
     _service_registry: Optional[ServiceRegistry] = None
 
+    # Resolved service URLs, normalized once (no trailing slash) so the
+    # proxy hot path can concatenate without re-running rstrip per request
+    _service_url_cache: Optional[dict] = None
+
     def get_service_url(self, service_name: str) -> str:
         """Get service URL using ServiceRegistry or legacy override.
 
+        The resolved URL is cached per service name and returned without a
+        trailing slash, so callers can append paths directly.
+
         Args:
             service_name: Service name (e.g., "auth", "session", "case")
 
         Returns:
-            Full service URL
+            Full service URL (no trailing slash)
 
         Example:
             >>> settings = Settings()
             >>> settings.get_service_url("auth")
             'http://fm-auth-service:8000'  # Docker mode
         """
+        if self._service_url_cache is None:
+            self._service_url_cache = {}
+        cached_url = self._service_url_cache.get(service_name)
+        if cached_url is not None:
+            return cached_url
+
         # Check for legacy manual override first
+        url = None
         override_attr = f"fm_{service_name}_service_url"
         if hasattr(self, override_attr):
             override_url = getattr(self, override_attr)
             if override_url:
-                return override_url
+                url = override_url
 
-        # Use ServiceRegistry for deployment-neutral URL resolution
-        if self._service_registry is None:
-            self._service_registry = get_service_registry()
+        if url is None:
+            # Use ServiceRegistry for deployment-neutral URL resolution
+            if self._service_registry is None:
+                self._service_registry = get_service_registry()
+            url = self._service_registry.get_url(service_name)
 
-        return self._service_registry.get_url(service_name)
+        url = url.rstrip("/")
+        self._service_url_cache[service_name] = url
+        return url
 
     # Gateway Configuration
     gateway_host: str = Field(
@@ -135,19 +154,13 @@ class Settings(BaseSettings):
         description="Role to use when auth is optional and no token is provided",
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins into list"""
+        """Parse CORS origins into list (split once per instance)"""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
 
-# Singleton settings instance
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create settings singleton"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -11,14 +11,43 @@ For distributed breaking across pods, use Redis backend.
 """
 
 import logging
+import os
+import sys
 import time
 from enum import Enum
 from typing import Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+# Write-behind batching for outcome recording: outcomes buffer in a plain
+# list and are applied under one lock acquisition per flush instead of one
+# per request
+_RECORD_BATCH_SIZE = 64
+_RECORD_FLUSH_INTERVAL = 0.1
+
+# Configuration parsed once at import time; the singleton getter only
+# instantiates, keeping env lookups and string parsing off the first request
+_CB_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+_CB_FAIL_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAIL_THRESHOLD", "5"))
+_CB_RESET_TIMEOUT = int(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
+
+# Backend services proxied by the gateway. Circuits for these are created
+# eagerly so the hot path never mutates the circuit dict; names are interned
+# so the handful of distinct keys resolve by pointer comparison in lookups.
+_KNOWN_SERVICES = tuple(
+    sys.intern(name)
+    for name in (
+        "fm-auth-service",
+        "fm-session-service",
+        "fm-case-service",
+        "fm-evidence-service",
+        "fm-knowledge-service",
+        "fm-agent-service",
+    )
+)
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -27,14 +56,20 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitStats:
-    """Circuit breaker statistics for a service."""
+    """Circuit breaker statistics for a service.
+
+    Each circuit carries its own lock so contention is per-service;
+    traffic to one backend never serializes against another.
+    """
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
     last_failure_time: Optional[float] = None
     opened_at: Optional[float] = None
     success_count_in_half_open: int = 0
+    half_open_in_flight: int = 0
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
 
 
 class CircuitBreaker:
@@ -82,15 +117,22 @@ class CircuitBreaker:
         self.half_open_max_calls = half_open_max_calls
         self.enabled = enabled
 
-        # Per-service circuit stats
-        self._circuits: Dict[str, CircuitStats] = {}
-        self._lock = Lock()
+        # Per-service circuit stats, pre-populated for the known backends
+        # so the hot path reads an existing entry instead of writing
+        self._circuits: Dict[str, CircuitStats] = {
+            name: CircuitStats() for name in _KNOWN_SERVICES
+        }
+
+        # Buffered (service_name, success) outcomes awaiting a batched flush
+        self._pending_records: list = []
+        self._last_flush = time.monotonic()
 
         logger.info(
-            f"Circuit breaker initialized: "
-            f"fail_threshold={fail_threshold}, "
-            f"reset_timeout={reset_timeout}s, "
-            f"enabled={enabled}"
+            "Circuit breaker initialized: "
+            "fail_threshold=%d, reset_timeout=%ds, enabled=%s",
+            fail_threshold,
+            reset_timeout,
+            enabled,
         )
 
     def is_call_allowed(self, service_name: str) -> bool:
@@ -106,10 +148,15 @@ class CircuitBreaker:
         if not self.enabled:
             return True
 
-        with self._lock:
-            circuit = self._get_or_create_circuit(service_name)
+        circuit = self._get_or_create_circuit(service_name)
+
+        # CLOSED fast path: a single attribute read is atomic in CPython,
+        # so the common case takes no lock at all
+        if circuit.state == CircuitState.CLOSED:
+            return True
 
-            # CLOSED: Allow call
+        with circuit.lock:
+            # Re-check under the lock; another thread may have transitioned
             if circuit.state == CircuitState.CLOSED:
                 return True
 
@@ -117,56 +164,126 @@ class CircuitBreaker:
             if circuit.state == CircuitState.OPEN:
                 if self._should_attempt_reset(circuit):
                     logger.info(
-                        f"Circuit {service_name}: OPEN -> HALF_OPEN (testing recovery)"
+                        "Circuit %s: OPEN -> HALF_OPEN (testing recovery)",
+                        service_name,
                     )
                     circuit.state = CircuitState.HALF_OPEN
                     circuit.success_count_in_half_open = 0
+                    circuit.half_open_in_flight = 1  # this request is the probe
                     return True
                 else:
-                    # Still in open state
-                    logger.warning(
-                        f"Circuit {service_name}: OPEN, rejecting request "
-                        f"(opened {int(time.time() - circuit.opened_at)}s ago)"
-                    )
+                    # Still in open state. Guarded so the rejected-request
+                    # fast path skips the time arithmetic when WARNING is off
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Circuit %s: OPEN, rejecting request (opened %ds ago)",
+                            service_name,
+                            int(time.monotonic() - circuit.opened_at),
+                        )
                     return False
 
-            # HALF_OPEN: Allow limited test requests
+            # HALF_OPEN: Admit at most half_open_max_calls concurrent probes;
+            # the rest are rejected instead of stampeding the recovering backend
             if circuit.state == CircuitState.HALF_OPEN:
-                return True
+                if circuit.half_open_in_flight < self.half_open_max_calls:
+                    circuit.half_open_in_flight += 1
+                    return True
+                return False
 
             return True  # Fallback
 
-    def record_success(self, service_name: str) -> None:
+    def record_async(self, service_name: str, success: bool) -> None:
         """
-        Record successful response from service.
+        Queue an outcome for write-behind recording.
+
+        Outcomes accumulate in a local buffer and are applied in one batch
+        (a single lock acquisition) once the buffer reaches
+        _RECORD_BATCH_SIZE entries or _RECORD_FLUSH_INTERVAL seconds have
+        passed since the last flush. Flushing is driven purely by these
+        calls — there is no timer — so under steady traffic transitions
+        lag by at most one flush window, but across a traffic pause
+        buffered outcomes sit unapplied until the next request records
+        its own outcome. The first request after an idle gap is therefore
+        admitted against pre-gap state (one extra probe at worst), which
+        is well inside the breaker's reset-timeout granularity.
 
         Args:
             service_name: Service identifier
+            success: True for a successful response, False for a failure
         """
         if not self.enabled:
             return
 
-        with self._lock:
+        self._pending_records.append((service_name, success))
+        if (
+            len(self._pending_records) >= _RECORD_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= _RECORD_FLUSH_INTERVAL
+        ):
+            self.flush_records()
+
+    def flush_records(self) -> None:
+        """Apply all buffered outcomes, one lock acquisition per service."""
+        self._last_flush = time.monotonic()
+        if not self._pending_records:
+            return
+
+        pending, self._pending_records = self._pending_records, []
+
+        # Group outcomes by service so each per-service lock is taken once
+        by_service: Dict[str, list] = {}
+        for service_name, success in pending:
+            by_service.setdefault(service_name, []).append(success)
+
+        for service_name, outcomes in by_service.items():
             circuit = self._get_or_create_circuit(service_name)
+            with circuit.lock:
+                for success in outcomes:
+                    if success:
+                        self._record_success_locked(service_name, circuit)
+                    else:
+                        self._record_failure_locked(service_name, circuit)
 
-            if circuit.state == CircuitState.HALF_OPEN:
-                circuit.success_count_in_half_open += 1
-                if circuit.success_count_in_half_open >= self.half_open_max_calls:
-                    logger.info(
-                        f"Circuit {service_name}: HALF_OPEN -> CLOSED (service recovered)"
-                    )
-                    circuit.state = CircuitState.CLOSED
-                    circuit.failure_count = 0
-                    circuit.success_count_in_half_open = 0
+    def record_success(self, service_name: str) -> None:
+        """
+        Record successful response from service.
 
-            elif circuit.state == CircuitState.CLOSED:
-                # Reset failure count on success
-                if circuit.failure_count > 0:
-                    logger.debug(
-                        f"Circuit {service_name}: Reset failure count "
-                        f"(was {circuit.failure_count})"
-                    )
-                    circuit.failure_count = 0
+        Args:
+            service_name: Service identifier
+        """
+        if not self.enabled:
+            return
+
+        circuit = self._get_or_create_circuit(service_name)
+        with circuit.lock:
+            self._record_success_locked(service_name, circuit)
+
+    def _record_success_locked(
+        self, service_name: str, circuit: CircuitStats
+    ) -> None:
+        """Apply one success outcome (caller holds the circuit's lock)."""
+        if circuit.state == CircuitState.HALF_OPEN:
+            if circuit.half_open_in_flight > 0:
+                circuit.half_open_in_flight -= 1
+            circuit.success_count_in_half_open += 1
+            if circuit.success_count_in_half_open >= self.half_open_max_calls:
+                logger.info(
+                    "Circuit %s: HALF_OPEN -> CLOSED (service recovered)",
+                    service_name,
+                )
+                circuit.state = CircuitState.CLOSED
+                circuit.failure_count = 0
+                circuit.success_count_in_half_open = 0
+                circuit.half_open_in_flight = 0
+
+        elif circuit.state == CircuitState.CLOSED:
+            # Reset failure count on success
+            if circuit.failure_count > 0:
+                logger.debug(
+                    "Circuit %s: Reset failure count (was %d)",
+                    service_name,
+                    circuit.failure_count,
+                )
+                circuit.failure_count = 0
 
     def record_failure(self, service_name: str) -> None:
         """
@@ -178,45 +295,72 @@ class CircuitBreaker:
         if not self.enabled:
             return
 
-        with self._lock:
-            circuit = self._get_or_create_circuit(service_name)
-            circuit.failure_count += 1
-            circuit.last_failure_time = time.time()
-
-            if circuit.state == CircuitState.HALF_OPEN:
-                # Failure during test -> reopen circuit
-                logger.warning(
-                    f"Circuit {service_name}: HALF_OPEN -> OPEN (test failed)"
+        circuit = self._get_or_create_circuit(service_name)
+        with circuit.lock:
+            self._record_failure_locked(service_name, circuit)
+
+    def _record_failure_locked(
+        self, service_name: str, circuit: CircuitStats
+    ) -> None:
+        """Apply one failure outcome (caller holds the circuit's lock)."""
+        # One clock read per failure, shared by both timestamps; monotonic
+        # so wall-clock adjustments can't distort the reset timeout
+        now = time.monotonic()
+        circuit.failure_count += 1
+        circuit.last_failure_time = now
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            # Failure during test -> reopen circuit
+            logger.warning(
+                "Circuit %s: HALF_OPEN -> OPEN (test failed)", service_name
+            )
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = now
+            circuit.success_count_in_half_open = 0
+            circuit.half_open_in_flight = 0
+
+        elif circuit.state == CircuitState.CLOSED:
+            # Check if should open circuit
+            if circuit.failure_count >= self.fail_threshold:
+                logger.error(
+                    "Circuit %s: CLOSED -> OPEN (%d consecutive failures)",
+                    service_name,
+                    circuit.failure_count,
                 )
                 circuit.state = CircuitState.OPEN
-                circuit.opened_at = time.time()
-                circuit.success_count_in_half_open = 0
-
-            elif circuit.state == CircuitState.CLOSED:
-                # Check if should open circuit
-                if circuit.failure_count >= self.fail_threshold:
-                    logger.error(
-                        f"Circuit {service_name}: CLOSED -> OPEN "
-                        f"({circuit.failure_count} consecutive failures)"
-                    )
-                    circuit.state = CircuitState.OPEN
-                    circuit.opened_at = time.time()
-                else:
-                    logger.warning(
-                        f"Circuit {service_name}: Failure recorded "
-                        f"({circuit.failure_count}/{self.fail_threshold})"
-                    )
+                circuit.opened_at = now
+            else:
+                logger.warning(
+                    "Circuit %s: Failure recorded (%d/%d)",
+                    service_name,
+                    circuit.failure_count,
+                    self.fail_threshold,
+                )
 
     def get_state(self, service_name: str) -> CircuitState:
-        """Get current circuit state for service."""
-        with self._lock:
-            circuit = self._get_or_create_circuit(service_name)
-            return circuit.state
+        """Get current circuit state for service.
+
+        Unknown services report CLOSED without allocating a circuit, so
+        read-only callers (health checks, stats endpoints) never grow the
+        circuit dict.
+        """
+        circuit = self._circuits.get(service_name)
+        if circuit is None:
+            return CircuitState.CLOSED
+        return circuit.state
+
+    def snapshot(self) -> Dict[str, CircuitState]:
+        """Return the current state of every tracked circuit.
+
+        Single pass over the circuit dict with plain attribute reads (each
+        is atomic in CPython); no locks are taken.
+        """
+        return {name: circuit.state for name, circuit in self._circuits.items()}
 
     def get_stats(self, service_name: str) -> dict:
         """Get circuit statistics for service."""
-        with self._lock:
-            circuit = self._get_or_create_circuit(service_name)
+        circuit = self._get_or_create_circuit(service_name)
+        with circuit.lock:
             return {
                 "state": circuit.state.value,
                 "failure_count": circuit.failure_count,
@@ -225,16 +369,24 @@ class CircuitBreaker:
             }
 
     def _get_or_create_circuit(self, service_name: str) -> CircuitStats:
-        """Get or create circuit stats for service."""
-        if service_name not in self._circuits:
-            self._circuits[service_name] = CircuitStats()
-        return self._circuits[service_name]
+        """Get or create circuit stats for service.
+
+        Known services are pre-populated, so this is a plain dict read on
+        the hot path; setdefault keeps the fallback write atomic under
+        the GIL.
+        """
+        circuit = self._circuits.get(service_name)
+        if circuit is None:
+            circuit = self._circuits.setdefault(
+                sys.intern(service_name), CircuitStats()
+            )
+        return circuit
 
     def _should_attempt_reset(self, circuit: CircuitStats) -> bool:
         """Check if enough time has passed to attempt circuit reset."""
         if not circuit.opened_at:
             return False
-        time_open = time.time() - circuit.opened_at
+        time_open = time.monotonic() - circuit.opened_at
         return time_open >= self.reset_timeout
 
 
@@ -246,15 +398,9 @@ def get_circuit_breaker() -> CircuitBreaker:
     """Get or create circuit breaker singleton."""
     global _circuit_breaker
     if _circuit_breaker is None:
-        # Read configuration from environment
-        import os
-        enabled = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
-        fail_threshold = int(os.getenv("CIRCUIT_BREAKER_FAIL_THRESHOLD", "5"))
-        reset_timeout = int(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
-
         _circuit_breaker = CircuitBreaker(
-            fail_threshold=fail_threshold,
-            reset_timeout=reset_timeout,
-            enabled=enabled,
+            fail_threshold=_CB_FAIL_THRESHOLD,
+            reset_timeout=_CB_RESET_TIMEOUT,
+            enabled=_CB_ENABLED,
         )
     return _circuit_breaker
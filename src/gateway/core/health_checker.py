@@ -9,8 +9,11 @@ This ensures Kubernetes only routes traffic to Gateway pods that can
 successfully handle requests end-to-end.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -19,6 +22,31 @@ from .circuit_breaker import get_circuit_breaker, CircuitState
 
 logger = logging.getLogger(__name__)
 
+# Readiness results are cached briefly so aggressive probe intervals (or
+# several probers hitting one pod) don't trigger a Redis ping per request
+_READINESS_CACHE_TTL = 1.0
+
+# Health payloads only need second resolution, so the formatted timestamp
+# is cached per wall-clock second instead of re-running strftime machinery
+# on every probe
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 'Z' string, cached per second."""
+    global _ts_cache
+    now_s = int(time.time())
+    cached = _ts_cache
+    if cached[0] == now_s:
+        return cached[1]
+    ts = (
+        datetime.fromtimestamp(now_s, timezone.utc)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+    _ts_cache = (now_s, ts)
+    return ts
+
 
 class HealthStatus(Enum):
     """Overall health status."""
@@ -27,7 +55,7 @@ class HealthStatus(Enum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentHealth:
     """Health status for a single component."""
     name: str
@@ -36,7 +64,7 @@ class ComponentHealth:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedHealth:
     """Aggregated health check result."""
     status: HealthStatus
@@ -86,6 +114,11 @@ class HealthChecker:
         self.redis_client = get_redis_client()
         self.circuit_breaker = get_circuit_breaker()
 
+        # (expires_at, result) for the last readiness check, plus a lock so
+        # concurrent probes coalesce into a single underlying check
+        self._readiness_cache: Optional[Tuple[float, AggregatedHealth]] = None
+        self._readiness_lock = asyncio.Lock()
+
     async def check_liveness(self) -> AggregatedHealth:
         """
         Liveness probe - check if Gateway process is alive.
@@ -97,13 +130,11 @@ class HealthChecker:
         Returns:
             AggregatedHealth with liveness status
         """
-        from datetime import datetime
-
         # If we can execute this code, the process is alive
         return AggregatedHealth(
             status=HealthStatus.HEALTHY,
             ready=True,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=_utc_timestamp(),
             components=[
                 ComponentHealth(
                     name="gateway_process",
@@ -126,24 +157,44 @@ class HealthChecker:
         2. Circuit breaker states (any services in OPEN state?)
         3. Service registry (deployment mode configured?)
 
+        Results are cached for _READINESS_CACHE_TTL seconds and concurrent
+        callers coalesce behind one in-flight check, so probe bursts cost a
+        single round of component checks. Liveness is never cached.
+
         Returns:
             AggregatedHealth with readiness status
         """
-        from datetime import datetime
-
-        components: List[ComponentHealth] = []
-
-        # Check 1: Redis connectivity
-        redis_health = await self._check_redis()
-        components.append(redis_health)
-
-        # Check 2: Circuit breaker states
-        circuit_health = await self._check_circuit_breakers()
-        components.append(circuit_health)
-
-        # Check 3: Service registry
-        registry_health = await self._check_service_registry()
-        components.append(registry_health)
+        cached = self._readiness_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        async with self._readiness_lock:
+            # Re-check: another prober may have refreshed while we waited
+            cached = self._readiness_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+
+            result = await self._compute_readiness()
+            self._readiness_cache = (
+                time.monotonic() + _READINESS_CACHE_TTL,
+                result,
+            )
+            return result
+
+    async def _compute_readiness(self) -> AggregatedHealth:
+        """Run the underlying component checks (uncached)."""
+        # The three checks are independent, so run them concurrently:
+        # probe latency becomes the slowest component instead of the sum
+        redis_health, circuit_health, registry_health = await asyncio.gather(
+            self._check_redis(),
+            self._check_circuit_breakers(),
+            self._check_service_registry(),
+        )
+        components: List[ComponentHealth] = [
+            redis_health,
+            circuit_health,
+            registry_health,
+        ]
 
         # Determine overall status
         overall_status, ready = self._aggregate_status(components)
@@ -151,7 +202,7 @@ class HealthChecker:
         return AggregatedHealth(
             status=overall_status,
             ready=ready,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=_utc_timestamp(),
             components=components,
         )
 
@@ -167,17 +218,26 @@ class HealthChecker:
                 details={"available": False, "impact": "Rate limiting is per-pod only"},
             )
 
-        # Try to ping Redis
+        # Ping Redis asynchronously with a hard latency bound, so a slow
+        # or wedged Redis can't stall the event loop or the probe
         try:
-            client = self.redis_client.client
+            client = self.redis_client.async_client
             if client:
-                client.ping()
+                await asyncio.wait_for(client.ping(), timeout=0.5)
                 return ComponentHealth(
                     name="redis",
                     status=HealthStatus.HEALTHY,
                     message="Redis is responsive",
                     details={"available": True, "mode": "standalone or sentinel"},
                 )
+        except asyncio.TimeoutError:
+            logger.error("Redis health check timed out after 0.5s")
+            return ComponentHealth(
+                name="redis",
+                status=HealthStatus.UNHEALTHY,
+                message="Redis ping timed out after 0.5s",
+                details={"available": False, "error": "timeout"},
+            )
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             return ComponentHealth(
@@ -204,21 +264,14 @@ class HealthChecker:
                 details={"enabled": False},
             )
 
-        # Known backend services
-        services = [
-            "fm-auth-service",
-            "fm-session-service",
-            "fm-case-service",
-            "fm-evidence-service",
-            "fm-knowledge-service",
-            "fm-agent-service",
-        ]
+        # One snapshot covers every tracked circuit (the breaker pre-populates
+        # the known backends) instead of a per-service get_state call
+        states = self.circuit_breaker.snapshot()
 
         open_circuits = []
         degraded_circuits = []
 
-        for service in services:
-            state = self.circuit_breaker.get_state(service)
+        for service, state in states.items():
             if state == CircuitState.OPEN:
                 open_circuits.append(service)
             elif state == CircuitState.HALF_OPEN:
@@ -234,7 +287,7 @@ class HealthChecker:
                 details={
                     "open_circuits": open_circuits,
                     "half_open_circuits": degraded_circuits,
-                    "total_services": len(services),
+                    "total_services": len(states),
                 },
             )
         elif degraded_circuits:
@@ -246,7 +299,7 @@ class HealthChecker:
                 details={
                     "open_circuits": open_circuits,
                     "half_open_circuits": degraded_circuits,
-                    "total_services": len(services),
+                    "total_services": len(states),
                 },
             )
         else:
@@ -258,7 +311,7 @@ class HealthChecker:
                 details={
                     "open_circuits": [],
                     "half_open_circuits": [],
-                    "total_services": len(services),
+                    "total_services": len(states),
                 },
             )
 
@@ -307,18 +360,16 @@ class HealthChecker:
         Returns:
             Tuple of (overall_status, ready_for_traffic)
         """
-        if any(c.status == HealthStatus.UNHEALTHY for c in components):
-            # Critical failure - not ready
-            return HealthStatus.UNHEALTHY, False
-
-        if any(c.status == HealthStatus.DEGRADED for c in components):
-            # Degraded but functional - still ready
-            # Gateway can handle traffic with reduced capability
-            # (e.g., per-pod rate limiting instead of distributed)
-            return HealthStatus.DEGRADED, True
-
-        # All components healthy
-        return HealthStatus.HEALTHY, True
+        # Single pass with early exit on critical failure. DEGRADED is still
+        # ready: the gateway can handle traffic with reduced capability
+        # (e.g., per-pod rate limiting instead of distributed)
+        worst = HealthStatus.HEALTHY
+        for c in components:
+            if c.status is HealthStatus.UNHEALTHY:
+                return HealthStatus.UNHEALTHY, False
+            if c.status is HealthStatus.DEGRADED:
+                worst = HealthStatus.DEGRADED
+        return worst, True
 
 
 # Singleton instance
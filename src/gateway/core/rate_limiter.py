@@ -6,16 +6,77 @@ Supports:
 - Graceful degradation (if Redis fails, allow traffic with warning)
 """
 
+import asyncio
 import logging
+import os
+import sys
 import time
+from array import array
 from typing import Optional
-from collections import defaultdict
 from threading import Lock
 
+from redis.exceptions import NoScriptError
+
 from ..infrastructure.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Configuration parsed once at import time; the singleton getter only
+# instantiates, keeping env lookups and string parsing off the first request
+_RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+_RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
+
+# In-memory buckets idle for longer than this are dropped; the sweep runs
+# opportunistically at most once per interval so one-off identifiers can't
+# grow the table without bound
+_BUCKET_IDLE_TTL = 3600.0
+_BUCKET_SWEEP_INTERVAL = 60.0
+
+# Redis checks micro-batch: concurrent callers park on futures and one
+# pipeline carries the whole batch, trading up to _BATCH_WINDOW seconds of
+# added latency for a bounded number of Redis round trips under load
+_BATCH_MAX_OPS = 50
+_BATCH_WINDOW = 0.001
+
+# X-RateLimit-Reset only has second resolution, so the formatted value is
+# cached per wall-clock second instead of str()-ing a fresh int per request
+_reset_cache: tuple = (0, "")
+
+
+def _reset_header() -> str:
+    """Unix timestamp of the next window boundary, cached per second."""
+    global _reset_cache
+    now_s = int(time.time())
+    cached = _reset_cache
+    if cached[0] == now_s:
+        return cached[1]
+    value = str(now_s + 60)
+    _reset_cache = (now_s, value)
+    return value
+
+
+# Fixed-window counter as a server-side script: INCR and the conditional
+# EXPIRE run atomically in one round trip, so the window TTL can never be
+# lost to a race between two clients on the first request of a window.
+_RATE_LIMIT_LUA = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], 60)
+end
+return current
+"""
+
+
+def _log_flush_task_error(task: "asyncio.Task") -> None:
+    """Surface failures from the background flush task.
+
+    Belt and braces: _flush_checks resolves every pending future itself,
+    so this should never fire, but a fire-and-forget task must not be
+    able to drop an exception silently.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Rate-limit batch flush failed: %s", task.exception())
+
 
 class RateLimiter:
     """Token bucket rate limiter with Redis backend."""
@@ -38,20 +99,49 @@ class RateLimiter:
         self.burst_size = burst_size or (requests_per_minute * 2)
         self.enabled = enabled
 
+        # The limit never changes, so its header value is formatted once
+        self._limit_str = str(requests_per_minute)
+
         # Redis client (may be None if Redis unavailable)
         self.redis = get_redis_client()
 
-        # In-memory fallback (per-process, not distributed)
-        self._memory_buckets: dict = defaultdict(lambda: {"tokens": self.burst_size, "last_update": time.time()})
+        # Shared async client from the infrastructure singleton (standalone
+        # or sentinel, matching the sync client); checks run on the event
+        # loop without blocking it for the Redis RTT
+        self._async_redis = self.redis.async_client
+
+        # Registered script handles SCRIPT LOAD / EVALSHA (with NOSCRIPT
+        # reload) transparently
+        self._rate_limit_script = (
+            self._async_redis.register_script(_RATE_LIMIT_LUA)
+            if self._async_redis is not None
+            else None
+        )
+
+        # In-memory fallback (per-process, not distributed), laid out as
+        # structure-of-arrays: two flat float64 buffers indexed through one
+        # identifier->slot dict, instead of a dict of per-bucket dicts.
+        # array('d') keeps the values contiguous and compact. Buckets use
+        # time.monotonic so wall-clock adjustments can't distort refills.
+        self._refill_per_second = self.requests_per_minute / 60.0
+        self._id_to_idx: dict = {}
+        self._tokens = array("d")
+        self._last_update = array("d")
         self._lock = Lock()
+        self._last_sweep = time.monotonic()
+
+        # (key, future) pairs awaiting the next batched Redis flush
+        self._pending_checks: list = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
         logger.info(
-            f"Rate limiter initialized: {requests_per_minute} req/min, "
-            f"burst={self.burst_size}, "
-            f"backend={'Redis' if self.redis.is_available() else 'in-memory'}"
+            "Rate limiter initialized: %d req/min, burst=%d, backend=%s",
+            requests_per_minute,
+            self.burst_size,
+            "Redis" if self._async_redis is not None else "in-memory",
         )
 
-    def is_allowed(self, identifier: str) -> tuple[bool, dict]:
+    async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
         """
         Check if request is allowed under rate limit.
 
@@ -65,75 +155,178 @@ class RateLimiter:
             return True, {}
 
         # Try Redis first
-        if self.redis.is_available():
-            return self._check_redis(identifier)
+        if self._async_redis is not None:
+            return await self._check_redis(identifier)
 
         # Fallback to in-memory
         logger.debug("Using in-memory rate limiter (Redis unavailable)")
         return self._check_memory(identifier)
 
-    def _check_redis(self, identifier: str) -> tuple[bool, dict]:
-        """Check rate limit using Redis backend."""
-        key = f"ratelimit:{identifier}"
-        window_key = f"{key}:window"
+    async def _check_redis(self, identifier: str) -> tuple[bool, dict]:
+        """Check rate limit using Redis backend.
 
-        try:
-            # Get current count
-            current = self.redis.incr(key)
+        Checks micro-batch: each caller parks on a future and the batch is
+        flushed as one pipelined round trip once _BATCH_MAX_OPS checks
+        accumulate or _BATCH_WINDOW seconds elapse, whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_checks.append((f"ratelimit:{identifier}", future))
+
+        if len(self._pending_checks) >= _BATCH_MAX_OPS:
+            await self._flush_checks()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                _BATCH_WINDOW,
+                lambda: loop.create_task(self._flush_checks()).add_done_callback(
+                    _log_flush_task_error
+                ),
+            )
 
-            # Set expiration on first request in window
-            if current == 1:
-                self.redis.expire(key, 60)
+        try:
+            current = int(await future)
 
             # Calculate remaining
             remaining = max(0, self.requests_per_minute - current)
             is_allowed = current <= self.requests_per_minute
 
             headers = {
-                "X-RateLimit-Limit": str(self.requests_per_minute),
+                "X-RateLimit-Limit": self._limit_str,
                 "X-RateLimit-Remaining": str(remaining),
-                "X-RateLimit-Reset": str(int(time.time()) + 60),
+                "X-RateLimit-Reset": _reset_header(),
             }
 
             if not is_allowed:
                 logger.warning(
-                    f"Rate limit exceeded for {identifier}: "
-                    f"{current}/{self.requests_per_minute} requests"
+                    "Rate limit exceeded for %s: %d/%d requests",
+                    identifier,
+                    current,
+                    self.requests_per_minute,
                 )
 
             return is_allowed, headers
 
         except Exception as e:
-            logger.warning(f"Redis rate limit check failed: {e}. Allowing request.")
+            logger.warning("Redis rate limit check failed: %s. Allowing request.", e)
             return True, {}  # Fail open
 
+    async def _flush_checks(self) -> None:
+        """Flush all pending checks as one pipelined round trip.
+
+        No exception may escape while futures are still pending: whatever
+        the batch raises is propagated to every parked waiter (each fails
+        open), so a flush failure can never leave a request hanging on an
+        unresolved future.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending_checks = self._pending_checks, []
+        if not pending:
+            return
+
+        try:
+            results = await self._execute_batch([key for key, _ in pending])
+        except Exception as e:
+            # Each waiter applies its own fail-open handling
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), current in zip(pending, results):
+            if not future.done():
+                future.set_result(current)
+
+    async def _execute_batch(self, keys: list) -> list:
+        """Run the window script for every key in a single pipeline."""
+        sha = self._rate_limit_script.sha
+
+        pipe = self._async_redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.evalsha(sha, 1, key)
+        try:
+            return await pipe.execute()
+        except NoScriptError:
+            # Script cache was flushed (e.g. Redis restart): reload and retry
+            await self._async_redis.script_load(_RATE_LIMIT_LUA)
+            pipe = self._async_redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.evalsha(sha, 1, key)
+            return await pipe.execute()
+
+    def _alloc_bucket(self, identifier: str) -> int:
+        """Assign the next bucket slot to identifier (caller holds the lock)."""
+        idx = len(self._tokens)
+        self._id_to_idx[sys.intern(identifier)] = idx
+        self._tokens.append(self.burst_size)
+        self._last_update.append(time.monotonic())
+        return idx
+
+    def _sweep_buckets(self, now: float) -> None:
+        """Compact the bucket arrays, dropping idle identifiers.
+
+        Caller holds the lock. One sequential pass over the flat arrays
+        copies live buckets into fresh buffers and rebuilds the slot map,
+        releasing the memory of everything idle past _BUCKET_IDLE_TTL.
+        """
+        self._last_sweep = now
+        cutoff = now - _BUCKET_IDLE_TTL
+        tokens, last_update = self._tokens, self._last_update
+
+        new_idx: dict = {}
+        new_tokens = array("d")
+        new_last_update = array("d")
+        for identifier, idx in self._id_to_idx.items():
+            if last_update[idx] > cutoff:
+                new_idx[identifier] = len(new_tokens)
+                new_tokens.append(tokens[idx])
+                new_last_update.append(last_update[idx])
+
+        swept = len(self._id_to_idx) - len(new_idx)
+        self._id_to_idx = new_idx
+        self._tokens = new_tokens
+        self._last_update = new_last_update
+        if swept:
+            logger.debug("Swept %d idle rate-limit buckets", swept)
+
     def _check_memory(self, identifier: str) -> tuple[bool, dict]:
         """Check rate limit using in-memory token bucket."""
         with self._lock:
-            bucket = self._memory_buckets[identifier]
-            now = time.time()
+            now = time.monotonic()
+            if now - self._last_sweep >= _BUCKET_SWEEP_INTERVAL:
+                self._sweep_buckets(now)
+
+            idx = self._id_to_idx.get(identifier)
+            if idx is None:
+                idx = self._alloc_bucket(identifier)
+
+            tokens = self._tokens
+            last_update = self._last_update
 
             # Refill tokens based on time elapsed
-            time_elapsed = now - bucket["last_update"]
-            tokens_to_add = time_elapsed * (self.requests_per_minute / 60.0)
-            bucket["tokens"] = min(self.burst_size, bucket["tokens"] + tokens_to_add)
-            bucket["last_update"] = now
+            refilled = min(
+                self.burst_size,
+                tokens[idx] + (now - last_update[idx]) * self._refill_per_second,
+            )
+            last_update[idx] = now
 
             # Check if token available
-            if bucket["tokens"] >= 1:
-                bucket["tokens"] -= 1
-                remaining = int(bucket["tokens"])
+            if refilled >= 1.0:
+                tokens[idx] = refilled - 1.0
                 headers = {
-                    "X-RateLimit-Limit": str(self.requests_per_minute),
-                    "X-RateLimit-Remaining": str(remaining),
+                    "X-RateLimit-Limit": self._limit_str,
+                    "X-RateLimit-Remaining": str(int(refilled - 1.0)),
                 }
                 return True, headers
             else:
+                tokens[idx] = refilled
                 logger.warning(
-                    f"Rate limit exceeded (in-memory) for {identifier}"
+                    "Rate limit exceeded (in-memory) for %s", identifier
                 )
                 headers = {
-                    "X-RateLimit-Limit": str(self.requests_per_minute),
+                    "X-RateLimit-Limit": self._limit_str,
                     "X-RateLimit-Remaining": "0",
                 }
                 return False, headers
@@ -147,13 +340,8 @@ def get_rate_limiter() -> RateLimiter:
     """Get or create rate limiter singleton."""
     global _rate_limiter
     if _rate_limiter is None:
-        # Read configuration from environment
-        import os
-        enabled = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
-        requests_per_minute = int(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
-
         _rate_limiter = RateLimiter(
-            requests_per_minute=requests_per_minute,
-            enabled=enabled,
+            requests_per_minute=_RATE_LIMIT_RPM,
+            enabled=_RATE_LIMIT_ENABLED,
         )
     return _rate_limiter
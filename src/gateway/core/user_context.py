@@ -1,7 +1,9 @@
 """User context data model extracted from JWT tokens"""
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import orjson
 
 
 @dataclass
@@ -13,6 +15,17 @@ class UserContext:
     roles: List[str]
     email_verified: bool
 
+    # Memoized header forms (see to_headers / to_header_bytes). A user's
+    # identity is fixed for the lifetime of the instance, so both are built
+    # once and reused; excluded from comparison/repr. Callers must not
+    # mutate the returned dict.
+    _headers: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _header_bytes: Optional[List[tuple]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_headers(self) -> dict[str, str]:
         """
         Convert user context to HTTP headers for downstream services.
@@ -22,12 +35,32 @@ class UserContext:
         - X-User-Email: User email address
         - X-User-Roles: JSON array of user roles
         - X-Email-Verified: Email verification status
+
+        The dict (including the serialized roles JSON) is built once per
+        instance and the same dict is returned on every call.
+        """
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = {
+                "X-User-ID": self.user_id,
+                "X-User-Email": self.email,
+                "X-User-Roles": orjson.dumps(self.roles).decode(),
+                "X-Email-Verified": str(self.email_verified).lower(),
+            }
+        return headers
+
+    def to_header_bytes(self) -> List[tuple]:
+        """
+        Get the context headers as pre-encoded ASGI header tuples.
+
+        Returns the lowercase (name, value) bytes pairs ready to append to
+        scope["headers"], memoized per instance so token-cache hits in the
+        auth middleware skip the str-to-bytes encoding entirely.
         """
-        import json
-
-        return {
-            "X-User-ID": self.user_id,
-            "X-User-Email": self.email,
-            "X-User-Roles": json.dumps(self.roles),
-            "X-Email-Verified": str(self.email_verified).lower(),
-        }
+        header_bytes = self._header_bytes
+        if header_bytes is None:
+            header_bytes = self._header_bytes = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in self.to_headers().items()
+            ]
+        return header_bytes
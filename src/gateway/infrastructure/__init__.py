@@ -1,8 +1,16 @@
-"""Infrastructure layer - Auth provider implementations and Redis client"""
+"""Infrastructure layer - Auth provider implementations and Redis client
 
-from .fm_auth_provider import FMAuthProvider
-from .supabase_provider import SupabaseProvider
-from .redis_client import get_redis_client, RedisClient
+Submodules are imported lazily (PEP 562) so importing the package doesn't
+pull the auth providers' HTTP/JWT stacks or the Redis client into processes
+that never reference them.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .fm_auth_provider import FMAuthProvider
+    from .supabase_provider import SupabaseProvider
+    from .redis_client import get_redis_client, RedisClient
 
 __all__ = [
     "FMAuthProvider",
@@ -10,3 +18,19 @@ __all__ = [
     "get_redis_client",
     "RedisClient",
 ]
+
+
+def __getattr__(name: str):
+    if name == "FMAuthProvider":
+        from .fm_auth_provider import FMAuthProvider
+        return FMAuthProvider
+    if name == "SupabaseProvider":
+        from .supabase_provider import SupabaseProvider
+        return SupabaseProvider
+    if name == "get_redis_client":
+        from .redis_client import get_redis_client
+        return get_redis_client
+    if name == "RedisClient":
+        from .redis_client import RedisClient
+        return RedisClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
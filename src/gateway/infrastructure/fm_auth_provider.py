@@ -1,18 +1,58 @@
 """fm-auth-service authentication provider implementation"""
 
+import asyncio
+import sys
 import time
 import logging
+from hashlib import blake2b
 from typing import Dict, Any, Optional
 import httpx
-from jose import jwt, jwk
-from jose.exceptions import JWTError, ExpiredSignatureError
-from jose.backends import RSAKey
+import jwt
+import orjson
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from jwt import PyJWK
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 from ..core.auth_provider import IAuthProvider
 from ..core.user_context import UserContext
 
 logger = logging.getLogger(__name__)
 
+# Verified-claims cache: RS256 verification costs a SHA-256 plus a 2048-bit
+# modexp, and clients replay the same bearer token for their whole session.
+# Entries are keyed by a short token digest (never the token itself) and
+# revalidated against the token's own exp on every hit. Note the gateway
+# middleware keeps its own exp-bounded cache in front of this provider, so
+# in-gateway traffic mostly hits that one first; this cache still covers
+# direct provider callers and middleware cold starts.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX_SIZE = 10_000
+
+# Expected claim values, built and interned once instead of per decode;
+# interning lets the claim comparison take CPython's identity fast path
+_AUDIENCE = sys.intern("faultmaven-api")
+_ISSUER = sys.intern("https://auth.faultmaven.ai")
+
+# Shared async client for JWKS fetches: refreshes ride a kept-alive
+# connection to fm-auth-service instead of paying TCP/TLS setup each time,
+# and never block the event loop
+_http_client = httpx.AsyncClient(
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+# Floor between forced JWKS refetches triggered by an unknown kid, so a
+# flood of tokens with bogus kids can't hammer fm-auth-service
+_UNKNOWN_KID_REFRESH_MIN_INTERVAL = 30.0
+
+# Shared JWKS cache keyed by URL:
+# jwks_url -> (expires_at, keys_by_kid, etag, last_modified).
+# Module-level so every provider instance pointed at the same endpoint
+# (tests, reloads) reuses one fetched key set. The validators feed
+# conditional refreshes: an unchanged key set revalidates with a 304
+# instead of a full download and re-parse.
+_jwks_cache: Dict[str, tuple] = {}
+
 
 class FMAuthProvider(IAuthProvider):
     """
@@ -36,12 +76,18 @@ class FMAuthProvider(IAuthProvider):
         self.service_url = service_url.rstrip("/")
         self.jwks_url = f"{self.service_url}/.well-known/jwks.json"
         self.cache_ttl = cache_ttl
-        self._cached_key = None
-        self._cache_time = 0
+        self._last_forced_refresh = 0.0
+
+        # token digest -> (cache_expires_at, token_exp, UserContext)
+        self._token_cache: dict = {}
+
+        # Coalesces concurrent JWKS refreshes into one fetch
+        self._refresh_lock = asyncio.Lock()
 
         logger.info(
-            f"Initialized FMAuthProvider with JWKS URL: {self.jwks_url} "
-            f"(cache TTL: {cache_ttl}s)"
+            "Initialized FMAuthProvider with JWKS URL: %s (cache TTL: %ss)",
+            self.jwks_url,
+            cache_ttl,
         )
 
     async def validate_token(self, token: str) -> UserContext:
@@ -63,18 +109,33 @@ class FMAuthProvider(IAuthProvider):
         Raises:
             ValueError: If token is invalid, expired, or signature verification fails
         """
+        # Serve recently verified tokens from cache; only the token's own
+        # expiry needs re-checking, not the signature
+        cache_key = blake2b(token.encode(), digest_size=16).digest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            cache_expires, token_exp, cached_context = cached
+            if time.monotonic() < cache_expires:
+                # Same boundary as jwt.decode (zero leeway): acceptance in
+                # the token's final seconds must not depend on cache state
+                if token_exp is None or token_exp > time.time():
+                    return cached_context
+                raise ValueError("Token has expired")
+
         try:
-            # Get public key (with caching)
-            public_key = self._get_public_key()
+            # Get the signing key matching this token's kid (with caching)
+            kid = jwt.get_unverified_header(token).get("kid")
+            public_key = await self._get_public_key(kid)
 
-            # Decode and validate token using python-jose
+            # Decode and validate token using PyJWT (thin wrapper over
+            # cryptography's OpenSSL RSA verify)
             # Note: fm-auth-service issues tokens with specific iss and aud
             claims = jwt.decode(
                 token,
                 public_key,
                 algorithms=["RS256"],
-                audience="faultmaven-api",
-                issuer="https://auth.faultmaven.ai",
+                audience=_AUDIENCE,
+                issuer=_ISSUER,
             )
 
             # Extract user context
@@ -85,9 +146,21 @@ class FMAuthProvider(IAuthProvider):
                 email_verified=claims.get("email_verified", False),
             )
 
-            logger.info(
-                f"Successfully validated token for user {user_context.user_id} "
-                f"via fm-auth-service"
+            # Bounded cache: wholesale clear is O(1) amortized and fine for
+            # a cache this cheap to refill
+            if len(self._token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+                self._token_cache.clear()
+            self._token_cache[cache_key] = (
+                time.monotonic() + _TOKEN_CACHE_TTL,
+                claims.get("exp"),
+                user_context,
+            )
+
+            # DEBUG, not INFO: this fires on every authenticated request, and
+            # %-style defers the format entirely when the level is off
+            logger.debug(
+                "Validated token for user %s via fm-auth-service",
+                user_context.user_id,
             )
 
             return user_context
@@ -96,63 +169,157 @@ class FMAuthProvider(IAuthProvider):
             logger.warning("Token validation failed: Token has expired")
             raise ValueError("Token has expired")
 
-        except JWTError as e:
-            logger.warning(f"Token validation failed: {str(e)}")
+        except InvalidTokenError as e:
+            logger.warning("Token validation failed: %s", e)
             raise ValueError(f"Invalid token: {str(e)}")
 
         except Exception as e:
-            logger.error(f"Unexpected error during token validation: {str(e)}")
+            logger.error("Unexpected error during token validation: %s", e)
             raise ValueError(f"Token validation error: {str(e)}")
 
     def get_provider_name(self) -> str:
         """Return the name of this authentication provider"""
         return "fm-auth-service"
 
-    def _get_public_key(self) -> str:
+    async def preload(self) -> None:
         """
-        Fetch public key from JWKS endpoint with caching.
+        Warm the JWKS cache ahead of the first request.
 
-        Returns:
-            Public key in PEM format
+        Fetches and caches the full key set without requiring a kid, so a
+        multi-key JWKS warms just as cleanly as a single-key one. Intended
+        for application startup; a no-op when the cache is already fresh.
 
         Raises:
-            ValueError: If JWKS endpoint is unreachable or invalid
+            ValueError: If the JWKS endpoint is unreachable or malformed
+        """
+        async with self._refresh_lock:
+            current_time = time.monotonic()
+            entry = _jwks_cache.get(self.jwks_url)
+            if entry is not None and current_time < entry[0]:
+                return
+            await self._refresh_public_key(current_time)
+
+    @staticmethod
+    def _lookup_key(
+        keys_by_kid: Dict[str, RSAPublicKey], kid: Optional[str]
+    ) -> Optional[RSAPublicKey]:
+        """Find the key for kid; tokens without a kid are only
+        unambiguous when a single key is published."""
+        if kid is not None:
+            return keys_by_kid.get(kid)
+        if len(keys_by_kid) == 1:
+            return next(iter(keys_by_kid.values()))
+        return None
+
+    async def _get_public_key(self, kid: Optional[str]) -> RSAPublicKey:
         """
-        # Check cache
-        current_time = time.time()
-        if self._cached_key and (current_time - self._cache_time) < self.cache_ttl:
-            return self._cached_key
+        Fetch the signing key for kid from the JWKS endpoint, with caching.
 
-        # Fetch JWKS
+        Cache misses coalesce behind a lock with a double-checked read, so
+        an expiring cache triggers exactly one JWKS round trip instead of a
+        thundering herd of identical fetches. An unknown kid on a fresh
+        cache forces one refetch (rate-limited) before rejecting, so key
+        rotations validate without waiting out the TTL.
+
+        Returns:
+            Constructed RSA public key object, ready for jwt.decode
+
+        Raises:
+            ValueError: If the JWKS endpoint is unreachable or no published
+                key matches kid
+        """
+        # Check cache (monotonic clock: TTL math is immune to wall-clock
+        # jumps from NTP corrections)
+        current_time = time.monotonic()
+        entry = _jwks_cache.get(self.jwks_url)
+        if entry is not None and current_time < entry[0]:
+            key = self._lookup_key(entry[1], kid)
+            if key is not None:
+                return key
+
+        async with self._refresh_lock:
+            # Re-check: another coroutine may have refreshed while we waited
+            current_time = time.monotonic()
+            entry = _jwks_cache.get(self.jwks_url)
+            if entry is not None and current_time < entry[0]:
+                key = self._lookup_key(entry[1], kid)
+                if key is not None:
+                    return key
+                # Fresh cache but no matching kid: a rotation may have just
+                # published new keys. Allow one forced refetch per interval.
+                if (
+                    current_time - self._last_forced_refresh
+                    < _UNKNOWN_KID_REFRESH_MIN_INTERVAL
+                ):
+                    raise ValueError(f"No signing key matches kid {kid!r}")
+                self._last_forced_refresh = current_time
+
+            keys_by_kid = await self._refresh_public_key(current_time)
+            key = self._lookup_key(keys_by_kid, kid)
+            if key is None:
+                raise ValueError(f"No signing key matches kid {kid!r}")
+            return key
+
+    async def _refresh_public_key(
+        self, current_time: float
+    ) -> Dict[str, RSAPublicKey]:
+        """Fetch the JWKS and rebuild the shared cache (caller holds the lock).
+
+        When a previous fetch is cached, the request is conditional
+        (If-None-Match / If-Modified-Since): key sets rotate rarely, so
+        most periodic refreshes come back 304 and just extend the cache
+        deadline — no body transfer, no JSON parse, no key construction.
+        """
         try:
-            response = httpx.get(self.jwks_url, timeout=5.0)
+            stale = _jwks_cache.get(self.jwks_url)
+            headers = {}
+            if stale is not None:
+                _, _, etag, last_modified = stale
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            response = await _http_client.get(self.jwks_url, headers=headers)
+
+            if response.status_code == 304 and stale is not None:
+                _jwks_cache[self.jwks_url] = (
+                    current_time + self.cache_ttl,
+                    stale[1],
+                    stale[2],
+                    stale[3],
+                )
+                logger.debug("JWKS unchanged (304), extended cache deadline")
+                return stale[1]
+
             response.raise_for_status()
-            jwks_data = response.json()
+            jwks_data = orjson.loads(response.content)
 
             if not jwks_data.get("keys"):
                 raise ValueError("No signing keys found in JWKS endpoint")
 
-            # Get first key (fm-auth-service only has one key)
-            jwk_data = jwks_data["keys"][0]
-
-            # Convert JWK to PEM format using python-jose
-            from jose.backends.cryptography_backend import CryptographyRSAKey
-
-            key_obj = jwk.construct(jwk_data, algorithm="RS256")
-            public_key_pem = key_obj.to_pem().decode("utf-8")
-
-            # Cache the key
-            self._cached_key = public_key_pem
-            self._cache_time = current_time
+            # Cache the cryptography key objects themselves: jwt.decode
+            # takes them directly, so a PEM round trip would just make
+            # every decode re-parse the same key material
+            keys_by_kid = {
+                jwk_data.get("kid", ""): PyJWK(jwk_data, algorithm="RS256").key
+                for jwk_data in jwks_data["keys"]
+            }
+            _jwks_cache[self.jwks_url] = (
+                current_time + self.cache_ttl,
+                keys_by_kid,
+                response.headers.get("etag"),
+                response.headers.get("last-modified"),
+            )
 
-            logger.debug(f"Fetched and cached public key from {self.jwks_url}")
+            logger.debug("Fetched and cached public key from %s", self.jwks_url)
 
-            return public_key_pem
+            return keys_by_kid
 
         except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch JWKS from {self.jwks_url}: {str(e)}")
+            logger.error("Failed to fetch JWKS from %s: %s", self.jwks_url, e)
             raise ValueError(f"Cannot fetch JWKS: {str(e)}")
 
         except Exception as e:
-            logger.error(f"Error processing JWKS: {str(e)}")
+            logger.error("Error processing JWKS: %s", e)
             raise ValueError(f"Invalid JWKS format: {str(e)}")
@@ -7,8 +7,10 @@ Supports deployment-neutral configuration:
 
 import logging
 import os
+import threading
 from typing import Optional
 from redis import Redis, Sentinel
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,7 @@ class RedisClient:
 
     def __init__(self):
         self.client: Optional[Redis] = None
+        self._async_client: Optional[aioredis.Redis] = None
         self._initialize_client()
 
     def _initialize_client(self) -> None:
@@ -59,12 +62,11 @@ class RedisClient:
             socket_timeout=5,
         )
 
-    def _init_sentinel(self) -> None:
-        """Initialize Redis Sentinel client for HA."""
+    @staticmethod
+    def _sentinel_config() -> tuple:
+        """Resolve sentinel hosts and master set from the environment."""
         sentinel_hosts_str = os.getenv("REDIS_SENTINEL_HOSTS", "localhost:26379")
         master_name = os.getenv("REDIS_MASTER_SET", "mymaster")
-        password = os.getenv("REDIS_PASSWORD")
-        db = int(os.getenv("REDIS_DB", "0"))
 
         # Parse sentinel hosts
         sentinel_hosts = [
@@ -72,6 +74,13 @@ class RedisClient:
             for host in sentinel_hosts_str.split(",")
         ]
         sentinel_hosts = [(host, int(port)) for host, port in sentinel_hosts]
+        return sentinel_hosts, master_name
+
+    def _init_sentinel(self) -> None:
+        """Initialize Redis Sentinel client for HA."""
+        sentinel_hosts, master_name = self._sentinel_config()
+        password = os.getenv("REDIS_PASSWORD")
+        db = int(os.getenv("REDIS_DB", "0"))
 
         sentinel = Sentinel(
             sentinel_hosts,
@@ -132,6 +141,59 @@ class RedisClient:
             logger.warning(f"Redis EXPIRE error for key {key}: {e}")
             return False
 
+    @property
+    def async_client(self) -> Optional[aioredis.Redis]:
+        """Async counterpart of the sync client, built lazily.
+
+        Mirrors the same environment configuration as the sync client
+        (standalone or sentinel) so event-loop callers can issue commands
+        without blocking the loop. In sentinel mode the async Sentinel
+        resolves the master itself; the sync pool's connection_kwargs
+        carry no host there, so they must not be scraped.
+        """
+        if self.client is None:
+            return None
+        if self._async_client is None:
+            mode = os.getenv("REDIS_MODE", "standalone").lower()
+            if mode == "sentinel":
+                self._async_client = self._init_async_sentinel()
+            else:
+                self._async_client = self._init_async_standalone()
+        return self._async_client
+
+    def _init_async_standalone(self) -> aioredis.Redis:
+        """Build the async client from the sync client's resolved config."""
+        kwargs = dict(self.client.connection_pool.connection_kwargs)
+        return aioredis.Redis(
+            host=kwargs.get("host", "localhost"),
+            port=kwargs.get("port", 6379),
+            password=kwargs.get("password"),
+            db=kwargs.get("db", 0),
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            max_connections=100,
+        )
+
+    def _init_async_sentinel(self) -> aioredis.Redis:
+        """Build the async client through an async Sentinel master lookup."""
+        sentinel_hosts, master_name = self._sentinel_config()
+        password = os.getenv("REDIS_PASSWORD")
+        db = int(os.getenv("REDIS_DB", "0"))
+
+        sentinel = aioredis.Sentinel(
+            sentinel_hosts,
+            socket_timeout=5,
+            password=password,
+        )
+        return sentinel.master_for(
+            master_name,
+            db=db,
+            decode_responses=True,
+            socket_timeout=5,
+            max_connections=100,
+        )
+
     def is_available(self) -> bool:
         """Check if Redis is available."""
         return self.client is not None
@@ -139,11 +201,22 @@ class RedisClient:
 
 # Singleton instance
 _redis_client: Optional[RedisClient] = None
+_redis_client_lock = threading.Lock()
 
 
 def get_redis_client() -> RedisClient:
-    """Get or create Redis client singleton."""
+    """Get or create Redis client singleton.
+
+    Double-checked locking: the fast path is a lock-free read, and the
+    lock only serializes the one-time construction so concurrent first
+    callers (threaded workers, asyncio.to_thread) can't each open their
+    own connection pool.
+    """
     global _redis_client
-    if _redis_client is None:
-        _redis_client = RedisClient()
-    return _redis_client
+    client = _redis_client
+    if client is None:
+        with _redis_client_lock:
+            client = _redis_client
+            if client is None:
+                client = _redis_client = RedisClient()
+    return client
@@ -13,14 +13,16 @@ import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request
+import httpx
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .core.auth_provider import IAuthProvider
 from .infrastructure import FMAuthProvider, SupabaseProvider
-from .api.middleware import AuthMiddleware, RateLimitMiddleware
-from .api.routes import router, proxy_request
+from .api.middleware import GatewayMiddleware
+from .api.routes import router, proxy_request, extract_service_name
 from .api.openapi_aggregator import OpenAPIAggregator
 
 # Configure logging
@@ -32,21 +34,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator:
-    """Application lifespan manager for startup/shutdown events"""
-    # Startup
-    settings = get_settings()
-    logger.info(f"Starting fm-api-gateway v1.0.0")
-    logger.info(f"Primary auth provider: {settings.primary_auth_provider}")
-    logger.info(f"Gateway listening on {settings.gateway_host}:{settings.gateway_port}")
-
-    yield
-
-    # Shutdown
-    logger.info("Shutting down fm-api-gateway")
-
-
 def create_app() -> FastAPI:
     """
     Create and configure FastAPI application.
@@ -66,12 +53,78 @@ def create_app() -> FastAPI:
         "agent": settings.get_service_url("agent"),
     })
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator:
+        """Application lifespan manager for startup/shutdown events"""
+        # Startup
+        logger.info(f"Starting fm-api-gateway v1.0.0")
+        logger.info(f"Primary auth provider: {settings.primary_auth_provider}")
+        logger.info(f"Gateway listening on {settings.gateway_host}:{settings.gateway_port}")
+
+        # Open the aggregator's pooled HTTP client so spec fetches reuse
+        # keep-alive connections across cache refreshes
+        await aggregator.startup()
+
+        # Long-lived client for proxying to backend services; the pool is
+        # sized for gateway fan-out so proxied calls reuse keep-alive
+        # connections instead of handshaking per request
+        app.state.backend_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=500,
+                keepalive_expiry=30,
+            ),
+        )
+
+        # One client per backend origin with HTTP/2 enabled: concurrent
+        # proxied requests to the same service multiplex over a single
+        # connection instead of each acquiring one from a shared pool.
+        # Keyed by the same service name proxy_request extracts from the URL.
+        app.state.backend_clients = {
+            extract_service_name(url): httpx.AsyncClient(
+                base_url=url,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=200,
+                ),
+                timeout=30.0,
+            )
+            for url in {
+                settings.get_service_url(name)
+                for name in ("auth", "session", "case", "evidence", "knowledge", "agent")
+            }
+        }
+
+        # Warm the JWKS cache so the first authenticated request doesn't
+        # pay the key-fetch round trip; a failure here just means the
+        # first request fetches as before, so it must not abort startup
+        if isinstance(auth_provider, FMAuthProvider):
+            try:
+                await auth_provider.preload()
+                logger.info("JWKS preloaded from fm-auth-service")
+            except Exception as e:
+                logger.warning("JWKS preload failed (will retry on first request): %s", e)
+
+        yield
+
+        # Shutdown
+        for client in app.state.backend_clients.values():
+            await client.aclose()
+        await app.state.backend_client.aclose()
+        await aggregator.shutdown()
+        logger.info("Shutting down fm-api-gateway")
+
     # Create FastAPI app with custom OpenAPI endpoint
     app = FastAPI(
         title="FaultMaven API Gateway",
         description="Hybrid Gateway + Auth Adapter Pattern",
         version="1.0.0",
         lifespan=lifespan,
+        # orjson-backed responses: C-level serialization for every JSON
+        # body the gateway produces itself (health, admin, errors)
+        default_response_class=ORJSONResponse,
         # Disable default OpenAPI docs - we'll use aggregated version
         docs_url=None,
         redoc_url=None,
@@ -90,15 +143,13 @@ def create_app() -> FastAPI:
     # Initialize auth provider based on configuration
     auth_provider = _create_auth_provider(settings)
 
-    # Add rate limiting middleware (runs BEFORE auth)
-    app.add_middleware(RateLimitMiddleware)
-
-    # Add authentication middleware
-    app.add_middleware(AuthMiddleware, auth_provider=auth_provider, settings=settings)
+    # Add fused rate limiting + authentication middleware (rate limit check
+    # runs before auth, same order as the previous two-middleware stack)
+    app.add_middleware(GatewayMiddleware, auth_provider=auth_provider, settings=settings)
 
     # Add custom OpenAPI endpoints
     @app.get("/openapi.json", include_in_schema=False)
-    async def get_unified_openapi():
+    async def get_unified_openapi(request: Request):
         """
         Get unified OpenAPI specification from all microservices.
 
@@ -121,7 +172,19 @@ def create_app() -> FastAPI:
             all FaultMaven microservices, including x-aggregation-metadata
             showing which services succeeded/failed during aggregation.
         """
-        return await aggregator.get_unified_spec()
+        # Pre-serialized (and pre-gzipped) at cache-population time; no
+        # per-request JSON encode or compression
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                content=await aggregator.get_unified_spec_gzip(),
+                media_type="application/json",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
+        return Response(
+            content=await aggregator.get_unified_spec_bytes(),
+            media_type="application/json",
+            headers={"Vary": "Accept-Encoding"},
+        )
 
     @app.get("/docs", include_in_schema=False)
     async def get_unified_docs():
@@ -265,214 +328,78 @@ def _create_auth_provider(settings) -> IAuthProvider:
         )
 
 
+# Proxy dispatch table: first path segment under /api/v1 -> (settings
+# service key, has root route). Hypotheses and solutions are part of cases,
+# so they proxy to fm-case-service.
+_PROXY_PREFIXES = {
+    "auth": ("auth", False),
+    "sessions": ("session", True),
+    "cases": ("case", True),
+    "evidence": ("evidence", True),
+    "hypotheses": ("case", True),
+    "solutions": ("case", True),
+    "knowledge": ("knowledge", True),
+    "agent": ("agent", True),
+}
+
+
 def _add_proxy_routes(app: FastAPI, settings) -> None:
     """
-    Add proxy routes for microservices.
+    Add the catch-all proxy routes for microservices.
 
-    Routes:
-    - /api/v1/auth/* -> fm-auth-service
-    - /api/v1/sessions/* -> fm-session-service
-    - /api/v1/cases/* -> fm-case-service (stub)
+    A single route pair ("/api/v1/{service}/{path:path}" plus the bare
+    "/api/v1/{service}") dispatches through a dict resolved once at
+    registration, so Starlette's linear route matching walks two entries
+    instead of one pair per prefix, and unknown prefixes 404 without
+    touching a backend.
 
     Args:
         app: FastAPI application
         settings: Application settings
     """
-
-    # Route: /api/v1/auth/* -> fm-auth-service
-    @app.api_route(
-        "/api/v1/auth/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_auth(request: Request, path: str):
-        """Proxy authentication requests to fm-auth-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("auth"),
-            path=f"/api/v1/auth/{path}",
-        )
-
-    # Route: /api/v1/sessions/* -> fm-session-service
-    @app.api_route(
-        "/api/v1/sessions/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_sessions(request: Request, path: str):
-        """Proxy session requests to fm-session-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("session"),
-            path=f"/api/v1/sessions/{path}",
-        )
-
-    # Route: /api/v1/sessions (no path) -> fm-session-service
-    @app.api_route(
-        "/api/v1/sessions",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_sessions_root(request: Request):
-        """Proxy session list/create requests to fm-session-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("session"),
-            path="/api/v1/sessions",
-        )
-
-    # Route: /api/v1/cases/* -> fm-case-service
-    @app.api_route(
-        "/api/v1/cases/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_cases(request: Request, path: str):
-        """Proxy case requests to fm-case-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("case"),
-            path=f"/api/v1/cases/{path}",
-        )
-
-    # Route: /api/v1/cases (no path) -> fm-case-service
-    @app.api_route(
-        "/api/v1/cases",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_cases_root(request: Request):
-        """Proxy case list/create requests to fm-case-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("case"),
-            path="/api/v1/cases",
-        )
-
-    # Route: /api/v1/evidence/* -> fm-evidence-service
-    @app.api_route(
-        "/api/v1/evidence/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_evidence(request: Request, path: str):
-        """Proxy evidence requests to fm-evidence-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("evidence"),
-            path=f"/api/v1/evidence/{path}",
-        )
-
-    # Route: /api/v1/evidence (no path) -> fm-evidence-service
-    @app.api_route(
-        "/api/v1/evidence",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_evidence_root(request: Request):
-        """Proxy evidence list/upload requests to fm-evidence-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("evidence"),
-            path="/api/v1/evidence",
-        )
-
-    # Route: /api/v1/hypotheses/* -> fm-case-service
-    @app.api_route(
-        "/api/v1/hypotheses/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_hypotheses(request: Request, path: str):
-        """Proxy hypothesis requests to fm-case-service (hypotheses are part of cases)"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("case"),
-            path=f"/api/v1/hypotheses/{path}",
-        )
-
-    # Route: /api/v1/hypotheses (no path) -> fm-case-service
-    @app.api_route(
-        "/api/v1/hypotheses",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_hypotheses_root(request: Request):
-        """Proxy hypothesis list/create requests to fm-case-service (hypotheses are part of cases)"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("case"),
-            path="/api/v1/hypotheses",
-        )
-
-    # Route: /api/v1/solutions/* -> fm-case-service
-    @app.api_route(
-        "/api/v1/solutions/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_solutions(request: Request, path: str):
-        """Proxy solution requests to fm-case-service (solutions are part of cases)"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("case"),
-            path=f"/api/v1/solutions/{path}",
+    dispatch: dict = {}
+    for segment, (service_key, has_root) in _PROXY_PREFIXES.items():
+        backend_url = settings.get_service_url(service_key)
+        dispatch[segment] = (
+            backend_url,
+            extract_service_name(backend_url),
+            has_root,
         )
 
-    # Route: /api/v1/solutions (no path) -> fm-case-service
-    @app.api_route(
-        "/api/v1/solutions",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_solutions_root(request: Request):
-        """Proxy solution requests to fm-case-service (solutions are part of cases)"""
+    async def proxy_service(request: Request, service: str, path: str):
+        """Proxy /api/v1/{service}/... requests to the mapped backend"""
+        entry = dispatch.get(service)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        backend_url, service_name, _ = entry
         return await proxy_request(
             request,
-            backend_url=settings.get_service_url("case"),
-            path="/api/v1/solutions",
+            backend_url=backend_url,
+            path=request.url.path,
+            service_name=service_name,
         )
 
-    # Route: /api/v1/knowledge/* -> fm-knowledge-service
-    @app.api_route(
-        "/api/v1/knowledge/{path:path}",
-        methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_knowledge(request: Request, path: str):
-        """Proxy knowledge requests to fm-knowledge-service"""
+    async def proxy_service_root(request: Request, service: str):
+        """Proxy /api/v1/{service} list/create requests to the mapped backend"""
+        entry = dispatch.get(service)
+        if entry is None or not entry[2]:
+            raise HTTPException(status_code=404, detail="Not Found")
+        backend_url, service_name, _ = entry
         return await proxy_request(
             request,
-            backend_url=settings.get_service_url("knowledge"),
-            path=f"/api/v1/knowledge/{path}",
+            backend_url=backend_url,
+            path=request.url.path,
+            service_name=service_name,
         )
 
-    # Route: /api/v1/knowledge (no path) -> fm-knowledge-service
-    @app.api_route(
-        "/api/v1/knowledge",
-        methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_knowledge_root(request: Request):
-        """Proxy knowledge requests to fm-knowledge-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("knowledge"),
-            path="/api/v1/knowledge",
-        )
-
-    # Route: /api/v1/agent/* -> fm-agent-service
-    @app.api_route(
-        "/api/v1/agent/{path:path}",
+    app.api_route(
+        "/api/v1/{service}/{path:path}",
         methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    )
-    async def proxy_agent(request: Request, path: str):
-        """Proxy agent requests to fm-agent-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("agent"),
-            path=f"/api/v1/agent/{path}",
-        )
-
-    # Route: /api/v1/agent (no path) -> fm-agent-service
-    @app.api_route(
-        "/api/v1/agent",
+    )(proxy_service)
+    app.api_route(
+        "/api/v1/{service}",
         methods=["GET", "POST", "OPTIONS"],
-    )
-    async def proxy_agent_root(request: Request):
-        """Proxy agent requests to fm-agent-service"""
-        return await proxy_request(
-            request,
-            backend_url=settings.get_service_url("agent"),
-            path="/api/v1/agent",
-        )
+    )(proxy_service_root)
 
     logger.info("Configured proxy routes using ServiceRegistry for deployment-neutral service discovery")
 
@@ -489,10 +416,18 @@ if __name__ == "__main__":
     # Configure logging level from settings
     logging.getLogger().setLevel(settings.log_level)
 
+    # uvloop + httptools (both pulled in by uvicorn[standard]) replace the
+    # default selector loop and pure-Python HTTP parser; the middleware
+    # stack awaits several coroutines per request, so per-await event-loop
+    # overhead dominates and the C implementations roughly double throughput
     uvicorn.run(
         "gateway.main:app",
         host=settings.gateway_host,
         port=settings.gateway_port,
         reload=True,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
         log_level=settings.log_level.lower(),
     )